@@ -1,19 +1,62 @@
 import os
 import sys
 import time
+import asyncio
 import psutil
 import ctypes
 import argparse
 import threading
 import logging
-import gc
+import logging.handlers
+import functools
+import array
+from concurrent.futures import ThreadPoolExecutor
+from collections import namedtuple
 from ctypes import wintypes
 from colorama import init, Fore, Back, Style
 
+# Optional: WMI process start events (needs the wmi and pywin32 packages)
+try:
+    import wmi
+    import pythoncom
+except ImportError:
+    wmi = None
+    pythoncom = None
+
 # Initialize colorama
 init(autoreset=True)
 # Windows API constants
-PROCESS_ALL_ACCESS = 0x1F0FFF
+PROCESS_SET_QUOTA = 0x0100
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+PROCESS_QUERY_INFORMATION = 0x0400
+PROCESS_VM_READ = 0x0010
+PROCESS_TERMINATE = 0x0001
+SYNCHRONIZE = 0x00100000
+WAIT_OBJECT_0 = 0
+# Minimum rights needed to set/empty the working set, read memory counters and
+# wait on the handle to learn when the process exits
+PROCESS_LIMIT_ACCESS = PROCESS_SET_QUOTA | PROCESS_QUERY_LIMITED_INFORMATION | SYNCHRONIZE
+ERROR_INVALID_HANDLE = 6
+ERROR_BAD_LENGTH = 24
+TOKEN_QUERY = 0x0008
+TokenElevation = 20
+QUOTA_LIMITS_HARDWS_MIN_DISABLE = 0x00000002
+QUOTA_LIMITS_HARDWS_MAX_ENABLE = 0x00000004
+JobObjectExtendedLimitInformation = 9
+JOB_OBJECT_LIMIT_WORKINGSET = 0x00000001
+# Lower working set bound passed along with a hard maximum
+MIN_WORKING_SET = 1024 * 1024
+# Lower bound for the aggressive shrink: 64MB or 60% of the current RSS
+AGGRESSIVE_MIN_WORKING_SET = 64 * 1024 * 1024
+HOT_SET_FRACTION = 0.6
+# Processes with more than this fraction of shared (mapped file / DLL) pages in their
+# working set are trimmed at most once per MAPPED_TRIM_INTERVAL seconds, since
+# emptying them just causes pageout/page-in storms
+SHARED_PAGE_THRESHOLD = 0.3
+MAPPED_TRIM_INTERVAL = 60
+# PSAPI_WORKING_SET_BLOCK.Shared, and the entry count the first QueryWorkingSet call tries
+WORKING_SET_SHARED_FLAG = 1 << 8
+WORKING_SET_QUERY_ENTRIES = 64 * 1024
 
 # Add a dictionary to store colors for different processes
 PROCESS_COLORS = {
@@ -22,167 +65,803 @@ PROCESS_COLORS = {
     "obs64": Fore.CYAN,
     "Code": Fore.BLUE,
 }
-# Windows API functions
-kernel32 = ctypes.windll.kernel32
+# Process names to look for when a monitored name doesn't match its executable
+PROCESS_ALIASES = {
+    "chrome": ["chrome", "Google Chrome"],
+}
+
+class PROCESS_MEMORY_COUNTERS_EX(ctypes.Structure):
+    _fields_ = [
+        ('cb', wintypes.DWORD),
+        ('PageFaultCount', wintypes.DWORD),
+        ('PeakWorkingSetSize', ctypes.c_size_t),
+        ('WorkingSetSize', ctypes.c_size_t),
+        ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+        ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+        ('PagefileUsage', ctypes.c_size_t),
+        ('PeakPagefileUsage', ctypes.c_size_t),
+        ('PrivateUsage', ctypes.c_size_t),
+    ]
+
+class MEMORYSTATUSEX(ctypes.Structure):
+    _fields_ = [
+        ('dwLength', wintypes.DWORD),
+        ('dwMemoryLoad', wintypes.DWORD),
+        ('ullTotalPhys', ctypes.c_ulonglong),
+        ('ullAvailPhys', ctypes.c_ulonglong),
+        ('ullTotalPageFile', ctypes.c_ulonglong),
+        ('ullAvailPageFile', ctypes.c_ulonglong),
+        ('ullTotalVirtual', ctypes.c_ulonglong),
+        ('ullAvailVirtual', ctypes.c_ulonglong),
+        ('ullAvailExtendedVirtual', ctypes.c_ulonglong),
+    ]
+
+class JOBOBJECT_BASIC_LIMIT_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ('PerProcessUserTimeLimit', wintypes.LARGE_INTEGER),
+        ('PerJobUserTimeLimit', wintypes.LARGE_INTEGER),
+        ('LimitFlags', wintypes.DWORD),
+        ('MinimumWorkingSetSize', ctypes.c_size_t),
+        ('MaximumWorkingSetSize', ctypes.c_size_t),
+        ('ActiveProcessLimit', wintypes.DWORD),
+        ('Affinity', ctypes.c_size_t),
+        ('PriorityClass', wintypes.DWORD),
+        ('SchedulingClass', wintypes.DWORD),
+    ]
+
+class IO_COUNTERS(ctypes.Structure):
+    _fields_ = [
+        ('ReadOperationCount', ctypes.c_ulonglong),
+        ('WriteOperationCount', ctypes.c_ulonglong),
+        ('OtherOperationCount', ctypes.c_ulonglong),
+        ('ReadTransferCount', ctypes.c_ulonglong),
+        ('WriteTransferCount', ctypes.c_ulonglong),
+        ('OtherTransferCount', ctypes.c_ulonglong),
+    ]
+
+class JOBOBJECT_EXTENDED_LIMIT_INFORMATION(ctypes.Structure):
+    _fields_ = [
+        ('BasicLimitInformation', JOBOBJECT_BASIC_LIMIT_INFORMATION),
+        ('IoInfo', IO_COUNTERS),
+        ('ProcessMemoryLimit', ctypes.c_size_t),
+        ('JobMemoryLimit', ctypes.c_size_t),
+        ('PeakProcessMemoryUsed', ctypes.c_size_t),
+        ('PeakJobMemoryUsed', ctypes.c_size_t),
+    ]
+
+# Same fields as psutil's memory_info() on Windows
+ProcessMemory = namedtuple('ProcessMemory', ['rss', 'wset', 'private'])
+
+# Windows API functions, bound once with explicit signatures so ctypes
+# doesn't guess argument conversions (or truncate 64-bit handles) per call
+kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+psapi = ctypes.WinDLL('psapi', use_last_error=True)
 GlobalMemoryStatusEx = kernel32.GlobalMemoryStatusEx
+GlobalMemoryStatusEx.argtypes = [ctypes.POINTER(MEMORYSTATUSEX)]
+GlobalMemoryStatusEx.restype = wintypes.BOOL
 SetProcessWorkingSetSize = kernel32.SetProcessWorkingSetSize
+SetProcessWorkingSetSize.argtypes = [wintypes.HANDLE, ctypes.c_size_t, ctypes.c_size_t]
+SetProcessWorkingSetSize.restype = wintypes.BOOL
+SetProcessWorkingSetSizeEx = kernel32.SetProcessWorkingSetSizeEx
+SetProcessWorkingSetSizeEx.argtypes = [wintypes.HANDLE, ctypes.c_size_t, ctypes.c_size_t, wintypes.DWORD]
+SetProcessWorkingSetSizeEx.restype = wintypes.BOOL
 OpenProcess = kernel32.OpenProcess
+OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+OpenProcess.restype = wintypes.HANDLE
 CloseHandle = kernel32.CloseHandle
+CloseHandle.argtypes = [wintypes.HANDLE]
+CloseHandle.restype = wintypes.BOOL
+WaitForSingleObject = kernel32.WaitForSingleObject
+WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+WaitForSingleObject.restype = wintypes.DWORD
+EmptyWorkingSet = psapi.EmptyWorkingSet
+EmptyWorkingSet.argtypes = [wintypes.HANDLE]
+EmptyWorkingSet.restype = wintypes.BOOL
+K32GetProcessMemoryInfo = kernel32.K32GetProcessMemoryInfo
+K32GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS_EX), wintypes.DWORD]
+K32GetProcessMemoryInfo.restype = wintypes.BOOL
+K32QueryWorkingSet = kernel32.K32QueryWorkingSet
+K32QueryWorkingSet.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+K32QueryWorkingSet.restype = wintypes.BOOL
+CreateJobObjectW = kernel32.CreateJobObjectW
+CreateJobObjectW.argtypes = [ctypes.c_void_p, wintypes.LPCWSTR]
+CreateJobObjectW.restype = wintypes.HANDLE
+SetInformationJobObject = kernel32.SetInformationJobObject
+SetInformationJobObject.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD]
+SetInformationJobObject.restype = wintypes.BOOL
+AssignProcessToJobObject = kernel32.AssignProcessToJobObject
+AssignProcessToJobObject.argtypes = [wintypes.HANDLE, wintypes.HANDLE]
+AssignProcessToJobObject.restype = wintypes.BOOL
+GetCurrentProcess = kernel32.GetCurrentProcess
+GetCurrentProcess.argtypes = []
+GetCurrentProcess.restype = wintypes.HANDLE
+advapi32 = ctypes.WinDLL('advapi32', use_last_error=True)
+OpenProcessToken = advapi32.OpenProcessToken
+OpenProcessToken.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE)]
+OpenProcessToken.restype = wintypes.BOOL
+GetTokenInformation = advapi32.GetTokenInformation
+GetTokenInformation.argtypes = [wintypes.HANDLE, ctypes.c_int, ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)]
+GetTokenInformation.restype = wintypes.BOOL
+
+logger = logging.getLogger(__name__)
+
+# Formatted by logging only when the record is actually emitted
+USAGE_LOG_FORMAT = ("%s: RAM usage (RSS): %.2f%% | %.2f MB, Working Set: %.2f%% | %.2f MB, "
+                    "Private Usage: %.2f%% | %.2f MB (Limited to %s%%)")
+# Console counterpart; the colour prefix and limit suffix are built once per limiter
+USAGE_DISPLAY_FORMAT = ("%sRAM usage (RSS): %.2f%% | %.2f MB, Working Set: %.2f%% | %.2f MB, "
+                        "Private Usage: %.2f%% | %.2f MB%s")
+
+# Buffered log records are written to ram_limiter.log at least this often (seconds)
+LOG_FLUSH_INTERVAL = 30
+LOG_BUFFER_CAPACITY = 1024
+
+# How often ProcessRegistry rescans the process table while WMI start events keep it current
+EVENT_RESCAN_INTERVAL = 60
+
+# Total physical RAM never changes while we run, so read it once
+_TOTAL_RAM = psutil.virtual_memory().total
+# Loop-invariant scale factors: percent of total RAM per byte, and MB per byte
+_PCT_PER_BYTE = 100.0 / _TOTAL_RAM
+_INV_MB = 1.0 / (1024 * 1024)
+
+# Filled in place by get_memory_status() instead of allocating a new struct per read
+_MEMORY_STATUS = MEMORYSTATUSEX()
+_MEMORY_STATUS.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+_MEMORY_STATUS_LOCK = threading.Lock()
+
+# --test allocates this much, holds it, then frees it for a few seconds (seconds)
+MEMORY_HOG_BYTES = 800 * 1024 * 1024
+MEMORY_HOG_HOLD = 30
+MEMORY_HOG_RELEASE = 5
+
+# Characters of the welcome banner written per animation frame
+WELCOME_CHUNK_SIZE = 64
+
+# Game Mode re-reads processes below this fraction of its limit only every
+# GAME_MODE_IDLE_RECHECK seconds instead of on every scan
+GAME_MODE_NEAR_LIMIT_FRACTION = 0.5
+GAME_MODE_IDLE_RECHECK = 20
+
+# Process table snapshots taken by get_process_id_by_name are reused for this long (seconds)
+SNAPSHOT_TTL = 5
+
+# Last PID resolved for each monitored name, shared by the monitoring threads
+_PID_CACHE = {}
+_PID_CACHE_LOCK = threading.Lock()
+
+def _query_token_elevation():
+    token = wintypes.HANDLE()
+    if not OpenProcessToken(GetCurrentProcess(), TOKEN_QUERY, ctypes.byref(token)):
+        return False
+    try:
+        elevation = wintypes.DWORD()
+        returned = wintypes.DWORD()
+        if not GetTokenInformation(token, TokenElevation, ctypes.byref(elevation),
+                                   ctypes.sizeof(elevation), ctypes.byref(returned)):
+            return False
+        return bool(elevation.value)
+    finally:
+        CloseHandle(token)
+
+# Elevation can't change for the lifetime of the process, so check the token once
+_IS_ADMIN = _query_token_elevation()
+
+def is_admin():
+    return _IS_ADMIN
 
 # Add this new class after the existing imports
 class GameMode:
     def __init__(self, ram_limit_mb=500, whitelist=None):
         self.ram_limit_mb = ram_limit_mb
-        self.whitelist = whitelist or ['explorer.exe', 'system', 'systemd', 
-                                     'svchost.exe', 'csrss.exe', 'winlogon.exe', 
-                                     'services.exe']
-        self.running = True
+        self.whitelist = frozenset(sys.intern(p.lower()) for p in (whitelist or ['explorer.exe', 'system', 'systemd',
+                                                                     'svchost.exe', 'csrss.exe', 'winlogon.exe',
+                                                                     'services.exe']))
+        # Set by stop(); waiting on it lets a stop request end the pause right away
+        self._stop_event = threading.Event()
+        # pid -> (Process, create_time, name, lowercased name); names never change for a
+        # given (pid, create_time), so they are read once when the PID first shows up
+        self._proc_cache = {}
+        # pid -> (last rss in MB, monotonic time it was read)
+        self._rss_samples = {}
+
+    def _refresh_process_cache(self):
+        """Sync the cache with psutil.pids(), building Process objects only for new PIDs"""
+        pids = psutil.pids()
+        live_pids = set(pids)
+        for pid in [pid for pid in self._proc_cache if pid not in live_pids]:
+            del self._proc_cache[pid]
+            self._rss_samples.pop(pid, None)
+
+        for pid in pids:
+            if pid in self._proc_cache:
+                continue
+            try:
+                proc = psutil.Process(pid)
+                name = proc.name()
+                # Names repeat across PIDs (svchost.exe, chrome.exe), so share one string each
+                self._proc_cache[pid] = (proc, proc.create_time(), name, sys.intern(name.lower()))
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                continue
 
     def start(self):
         print(f"{Fore.GREEN}Game Mode activated. RAM limit: {self.ram_limit_mb}MB{Style.RESET_ALL}")
-        print(f"{Fore.CYAN}Whitelisted processes: {', '.join(self.whitelist)}{Style.RESET_ALL}")
-        while self.running:
+        print(f"{Fore.CYAN}Whitelisted processes: {', '.join(sorted(self.whitelist))}{Style.RESET_ALL}")
+        while not self._stop_event.is_set():
             try:
-                for proc in psutil.process_iter(['name', 'memory_info']):
+                self._refresh_process_cache()
+                now = time.monotonic()
+                # Bind loop invariants to locals; this loop runs once per process per scan
+                ram_limit_mb = self.ram_limit_mb
+                near_limit_mb = ram_limit_mb * GAME_MODE_NEAR_LIMIT_FRACTION
+                whitelist = self.whitelist
+                samples = self._rss_samples
+                inv_mb = _INV_MB
+                for pid, (proc, _, name, name_lower) in list(self._proc_cache.items()):
                     try:
-                        if proc.name().lower() not in self.whitelist:
-                            memory_mb = proc.memory_info().rss / (1024 * 1024)
-                            if memory_mb > self.ram_limit_mb:
+                        if name_lower not in whitelist:
+                            # Processes well under the limit are re-read only every
+                            # GAME_MODE_IDLE_RECHECK seconds; new ones are always measured
+                            sample = samples.get(pid)
+                            if (sample is not None and sample[0] <= near_limit_mb
+                                    and now - sample[1] < GAME_MODE_IDLE_RECHECK):
+                                continue
+                            memory_mb = proc.memory_info().rss * inv_mb
+                            samples[pid] = (memory_mb, now)
+                            if memory_mb > ram_limit_mb:
+                                # kill() re-checks create_time, so a reused PID raises NoSuchProcess
                                 proc.kill()
-                                print(f"{Fore.RED}Terminated {proc.name()} using {memory_mb:.2f}MB{Style.RESET_ALL}")
-                                logging.info(f"Game Mode terminated {proc.name()} using {memory_mb:.2f}MB")
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
+                                del self._proc_cache[pid]
+                                self._rss_samples.pop(pid, None)
+                                print(f"{Fore.RED}Terminated {name} using {memory_mb:.2f}MB{Style.RESET_ALL}")
+                                logger.info("Game Mode terminated %s using %.2fMB", name, memory_mb)
+                    except psutil.NoSuchProcess:
+                        # Gone, or its PID was reused; rebuild the entry on the next refresh
+                        self._proc_cache.pop(pid, None)
+                        self._rss_samples.pop(pid, None)
+                    except psutil.AccessDenied:
                         continue
-                time.sleep(2)
+                self._stop_event.wait(2)
             except KeyboardInterrupt:
                 self.stop()
 
     def stop(self):
-        self.running = False
+        self._stop_event.set()
         print(f"{Fore.YELLOW}Game Mode deactivated{Style.RESET_ALL}")
 
+def _flush_logs_periodically(handler):
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        handler.flush()
+
 def setup_logging():
-    logging.basicConfig(filename='ram_limiter.log', level=logging.INFO,
-                        format='%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    # The file is only opened once the first batch of records is written
+    file_handler = logging.FileHandler('ram_limiter.log', delay=True)
+    file_handler.setFormatter(logging.Formatter('%(asctime)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S'))
+
+    # Buffer records in memory; errors and a full buffer flush straight away,
+    # everything else is written in one batch every LOG_FLUSH_INTERVAL seconds
+    memory_handler = logging.handlers.MemoryHandler(capacity=LOG_BUFFER_CAPACITY, flushLevel=logging.ERROR,
+                                                    target=file_handler)
+    logging.basicConfig(level=logging.INFO, handlers=[memory_handler])
+    threading.Thread(target=_flush_logs_periodically, args=(memory_handler,), daemon=True).start()
+
+@functools.lru_cache(maxsize=None)
+def _get_target_names(name):
+    """Exact (lowercased) process names that count as a match for a monitored name"""
+    aliases = PROCESS_ALIASES.get(name.lower(), [name])
+    return frozenset(alias.lower() for base in aliases for alias in (base, f"{base}.exe"))
+
+def _name_matches(process_name, target_names):
+    return process_name.lower() in target_names
+
+class _SnapshotCache:
+    """Process table snapshot shared by every get_process_id_by_name caller.
+
+    The first lookup after SNAPSHOT_TTL seconds takes a new snapshot from
+    psutil.pids(); every other lookup (from any thread, for any name) within
+    that window reuses it. Process objects and their names are cached per
+    PID, and RSS is only read for processes whose name someone asked for.
+    """
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.taken_at = None
+        self.wanted_names = set()
+        self.processes = {}  # pid -> (Process, lowercased name)
+        self.by_name = {}  # lowercased name -> (pid, rss) of its largest process
+
+    def lookup(self, target_names):
+        with self.lock:
+            now = time.monotonic()
+            if not target_names <= self.wanted_names:
+                self.wanted_names |= target_names
+                self.taken_at = None
+            if self.taken_at is None or now - self.taken_at >= self.ttl:
+                self._take_snapshot()
+                self.taken_at = now
+            return [self.by_name[target] for target in target_names if target in self.by_name]
+
+    def _take_snapshot(self):
+        pids = psutil.pids()
+        live_pids = set(pids)
+        for pid in [pid for pid in self.processes if pid not in live_pids]:
+            del self.processes[pid]
+
+        by_name = {}
+        for pid in pids:
+            try:
+                cached = self.processes.get(pid)
+                if cached is None:
+                    proc = psutil.Process(pid)
+                    cached = self.processes[pid] = (proc, proc.name().lower())
+                proc, proc_name = cached
+                if proc_name in self.wanted_names:
+                    # Keep a running max per name rather than every matching PID
+                    rss = proc.memory_info().rss
+                    best = by_name.get(proc_name)
+                    if best is None or rss > best[1]:
+                        by_name[proc_name] = (pid, rss)
+            except (psutil.NoSuchProcess, psutil.ZombieProcess):
+                self.processes.pop(pid, None)
+            except psutil.AccessDenied:
+                pass
+        self.by_name = by_name
+
+_SNAPSHOT_CACHE = _SnapshotCache(SNAPSHOT_TTL)
 
 def get_process_id_by_name(name):
-    pids = []
-    chrome_names = ["chrome", "chrome.exe", "Google Chrome"]
-    target_names = [name.lower()] if name.lower() != "chrome" else [n.lower() for n in chrome_names]
+    target_names = _get_target_names(name)
+    key = name.lower()
 
-    for proc in psutil.process_iter(['name', 'memory_info']):
+    # Fast path: reuse the PID found on a previous call while it still matches
+    with _PID_CACHE_LOCK:
+        cached_pid = _PID_CACHE.get(key)
+    if cached_pid is not None:
         try:
-            if any(target_name in proc.info['name'].lower() for target_name in target_names):
-                pids.append((proc.pid, proc.info['memory_info'].rss))
+            if _name_matches(psutil.Process(cached_pid).name(), target_names):
+                return cached_pid
         except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
             pass
 
-    if pids:
-        return max(pids, key=lambda x: x[1])[0]
-    return None
-
-def limit_ram_for_process(name, interval, max_memory_percent=75):
-    print(f"Limiting RAM usage for {name}...")
-    logging.info(f"Started monitoring {name}")
-    process_color = PROCESS_COLORS.get(name.lower(), Fore.WHITE)
-    while True:
-        pid = get_process_id_by_name(name)
+    pids = _SNAPSHOT_CACHE.lookup(target_names)
+    pid = max(pids, key=lambda x: x[1])[0] if pids else None
+    with _PID_CACHE_LOCK:
         if pid is None:
-            print(f"{name} process not found. Retrying...")
-            logging.warning(f"{name} process not found")
-            time.sleep(interval)
-            continue
-
+            _PID_CACHE.pop(key, None)
+        else:
+            _PID_CACHE[key] = pid
+    return pid
+
+class ProcessRegistry:
+    """Shared {name: (pid, rss)} view of the monitored processes.
+
+    A single scanner thread walks the process table once per interval and
+    matches every monitored name in the same pass, so the worker threads
+    only do a dictionary lookup instead of their own process_iter scan.
+    When WMI is available, newly started processes are picked up from
+    Win32_ProcessStartTrace events and the full scan only runs every
+    EVENT_RESCAN_INTERVAL seconds (or when a worker loses its process).
+    """
+    def __init__(self, process_names):
+        # Reverse lookup from an exact process name to the monitored name it belongs to
+        self.name_to_key = {target: name.lower() for name in process_names for target in _get_target_names(name)}
+        self.processes = {}
+        self.lock = threading.RLock()
+        self.rescan_event = threading.Event()
+        self.events_available = False
+
+    def refresh(self):
+        found = {}
+        for proc in psutil.process_iter(['name', 'memory_info']):
+            try:
+                proc_name = proc.info['name']
+                memory_info = proc.info['memory_info']
+                if not proc_name or memory_info is None:
+                    continue
+                key = self.name_to_key.get(proc_name.lower())
+                if key is not None and (key not in found or memory_info.rss > found[key][1]):
+                    found[key] = (proc.pid, memory_info.rss)
+            except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+                pass
+
+        with self.lock:
+            self.processes = found
+
+    def get(self, name):
+        with self.lock:
+            entry = self.processes.get(name.lower())
+        return entry[0] if entry else None
+
+    def add(self, pid, process_name):
+        """Record a newly started process for a monitored name with no live PID yet"""
+        with self.lock:
+            key = self.name_to_key.get(process_name.lower())
+            if key is None:
+                return
+            entry = self.processes.get(key)
+            # Replace an entry whose process has exited but hasn't been discarded yet
+            if entry is None or not psutil.pid_exists(entry[0]):
+                self.processes[key] = (pid, 0)
+
+    def discard(self, name, pid):
+        """Forget pid for a monitored name once that process has exited"""
+        with self.lock:
+            key = name.lower()
+            entry = self.processes.get(key)
+            if entry is not None and entry[0] == pid:
+                del self.processes[key]
+
+    def request_refresh(self):
+        """Wake the scanner thread for an immediate rescan (e.g. a monitored process exited)"""
+        self.rescan_event.set()
+
+    def loop(self, interval):
+        while True:
+            try:
+                self.refresh()
+            except Exception as ex:
+                logger.error("Error scanning processes: %s", ex)
+            self.rescan_event.wait(EVENT_RESCAN_INTERVAL if self.events_available else interval)
+            self.rescan_event.clear()
+
+    def watch_process_starts(self):
+        """Feed Win32_ProcessStartTrace events into the registry until WMI fails"""
+        pythoncom.CoInitialize()
         try:
-            process = psutil.Process(pid)
+            watcher = wmi.WMI().watch_for(raw_wql="SELECT * FROM Win32_ProcessStartTrace")
+            self.events_available = True
+            logger.info("Watching WMI process start events")
+            while True:
+                event = watcher()
+                self.add(event.ProcessID, event.ProcessName)
+        except Exception as ex:
+            logger.warning("WMI process start events unavailable, polling instead: %s", ex)
+        finally:
+            self.events_available = False
+            self.request_refresh()
+            pythoncom.CoUninitialize()
+
+    def start(self, interval):
+        """Do the initial scan and start the background threads that keep the registry current"""
+        self.refresh()
+        threading.Thread(target=self.loop, args=(interval,), daemon=True).start()
+        if wmi is not None:
+            threading.Thread(target=self.watch_process_starts, daemon=True).start()
+
+def get_process_memory(handle):
+    """Read the memory counters of an open process handle, or None if the call fails"""
+    counters = PROCESS_MEMORY_COUNTERS_EX()
+    counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS_EX)
+    if not K32GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return ProcessMemory(counters.WorkingSetSize, counters.WorkingSetSize, counters.PrivateUsage)
+
+def get_shared_page_fraction(pid):
+    """Fraction of a process' working set pages that are shared, or None if it can't be read"""
+    handle = OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, pid)
+    if not handle:
+        return None
+    try:
+        count = WORKING_SET_QUERY_ENTRIES
+        # The working set can grow between calls, so retry a couple of times with room to spare
+        for _ in range(3):
+            # PSAPI_WORKING_SET_INFORMATION: NumberOfEntries followed by one block per page
+            buffer = (ctypes.c_size_t * (count + 1))()
+            if K32QueryWorkingSet(handle, buffer, ctypes.sizeof(buffer)):
+                entries = buffer[0]
+                if not entries:
+                    return 0.0
+                shared = sum(1 for block in buffer[1:entries + 1] if block & WORKING_SET_SHARED_FLAG)
+                return shared / entries
+            if ctypes.get_last_error() != ERROR_BAD_LENGTH:
+                return None
+            count = buffer[0] + 1024
+        return None
+    finally:
+        CloseHandle(handle)
+
+def create_working_set_job(max_memory):
+    """Create a job object that caps the working set of every process in it, or None"""
+    job = CreateJobObjectW(None, None)
+    if not job:
+        return None
+    info = JOBOBJECT_EXTENDED_LIMIT_INFORMATION()
+    info.BasicLimitInformation.LimitFlags = JOB_OBJECT_LIMIT_WORKINGSET
+    info.BasicLimitInformation.MinimumWorkingSetSize = MIN_WORKING_SET
+    info.BasicLimitInformation.MaximumWorkingSetSize = max_memory
+    if not SetInformationJobObject(job, JobObjectExtendedLimitInformation,
+                                   ctypes.byref(info), ctypes.sizeof(info)):
+        CloseHandle(job)
+        return None
+    return job
+
+def assign_to_job(job, pid):
+    """Put a process into a job object; returns False if it couldn't be assigned"""
+    handle = OpenProcess(PROCESS_SET_QUOTA | PROCESS_TERMINATE, False, pid)
+    if not handle:
+        return False
+    try:
+        return bool(AssignProcessToJobObject(job, handle))
+    finally:
+        CloseHandle(handle)
 
-            # Get system memory info
-            total_ram = psutil.virtual_memory().total
-            max_memory = int(total_ram * (max_memory_percent / 100))
+class ProcessLimiter:
+    """Working set limiting for one monitored process name, one tick at a time.
 
-            # Cap max_memory to 2GB (adjust if needed)
-            max_memory = min(max_memory, 2 * 1024 * 1024 * 1024)
+    Holds the state that has to survive between ticks (the open process
+    handle and whether the kernel accepted a hard cap for it), so the same
+    object can be driven by a blocking loop or by the asyncio scheduler.
+    """
+    def __init__(self, name, max_memory_percent=75, registry=None):
+        self.name = name
+        self.max_memory_percent = max_memory_percent
+        self.registry = registry
+        self.upper_name = name.upper()
+        process_color = PROCESS_COLORS.get(name.lower(), Fore.WHITE)
+        self.display_prefix = f"{process_color}{self.upper_name}: "
+        self.display_suffix = f" (Limited to {max_memory_percent}%){Style.RESET_ALL}"
+
+        # Cap max_memory to 2GB (adjust if needed)
+        self.max_memory = min(int(_TOTAL_RAM * (max_memory_percent / 100)), 2 * 1024 * 1024 * 1024)
+
+        # Handle to the monitored process, kept open across ticks until its PID changes
+        self.handle_pid = None
+        self.handle = None
+        self.hard_limited = False
+        # Job object whose working set cap the kernel applies to each PID we assign to it
+        self.job = create_working_set_job(self.max_memory)
+        # Set per PID when most of its working set is shared pages; trims are then throttled
+        self.mapped_heavy = False
+        self.last_trim = 0.0
+        # psutil.Process for the monitored PID, reused until it stops running
+        self.process = None
+        # Held for a whole tick so close() can't free the handle while a tick
+        # (e.g. one still running in an executor thread on shutdown) is using it
+        self.handle_lock = threading.Lock()
+
+        print(f"Limiting RAM usage for {name}...")
+        logger.info("Started monitoring %s", name)
+
+    def close(self):
+        with self.handle_lock:
+            self._release_handle()
+            # Assigned processes stay in the job (and under its limit) after this
+            if self.job:
+                CloseHandle(self.job)
+                self.job = None
+
+    def _release_handle(self):
+        if self.handle:
+            CloseHandle(self.handle)
+        self.handle_pid, self.handle = None, None
+        self.hard_limited = False
+        self.mapped_heavy = False
+
+    def _empty_working_set(self, handle):
+        """EmptyWorkingSet, throttled for processes backed mostly by shared pages"""
+        now = time.monotonic()
+        if self.mapped_heavy and now - self.last_trim < MAPPED_TRIM_INTERVAL:
+            return False
+        self.last_trim = now
+        return EmptyWorkingSet(handle)
+
+    def tick(self):
+        with self.handle_lock:
+            self._tick()
+
+    def _tick(self):
+        name = self.name
+        max_memory = self.max_memory
+        # Rediscover the PID only once the process we were limiting is gone
+        process = self.process
+        if process is not None:
+            if self.handle:
+                # A process handle is signalled when the process exits; polling it with a
+                # zero timeout is a single kernel call
+                alive = WaitForSingleObject(self.handle, 0) != WAIT_OBJECT_0
+            else:
+                alive = process.is_running()
+            if not alive:
+                # The PID may already belong to another process, so don't look the name
+                # up again this tick: drop the dead PID and let the registry rescan
+                self._release_handle()
+                self.process = None
+                if self.registry:
+                    self.registry.discard(name, process.pid)
+                    self.registry.request_refresh()
+                logger.info("%s (PID: %d) exited", name, process.pid)
+                return
+        if process is None:
+            pid = self.registry.get(name) if self.registry else get_process_id_by_name(name)
+            if pid is None:
+                self._release_handle()
+                print(f"{name} process not found. Retrying...")
+                logger.warning("%s process not found", name)
+                return
+        else:
+            pid = process.pid
 
-            # Open process with all access
-            handle = OpenProcess(PROCESS_ALL_ACCESS, False, pid)
+        try:
+            if process is None:
+                self.process = process = psutil.Process(pid)
+
+            # Reopen only when the monitored PID changed (or the last open failed)
+            if pid != self.handle_pid:
+                self._release_handle()
+                self.handle = OpenProcess(PROCESS_LIMIT_ACCESS, False, pid)
+                self.handle_pid = pid if self.handle else None
+
+                # Ask the kernel to enforce max_memory once per PID, through the job object
+                # or else a hard cap on the process; if both are refused, fall back to
+                # re-applying a soft cap every tick
+                self.hard_limited = bool(self.job) and assign_to_job(self.job, pid)
+                if self.hard_limited:
+                    logger.info("Assigned %s (PID: %d) to a working set limited job", name, pid)
+                else:
+                    self.hard_limited = bool(self.handle) and bool(SetProcessWorkingSetSizeEx(
+                        self.handle, MIN_WORKING_SET, max_memory,
+                        QUOTA_LIMITS_HARDWS_MAX_ENABLE | QUOTA_LIMITS_HARDWS_MIN_DISABLE))
+                    if self.hard_limited:
+                        logger.info("Applied hard working set limit to %s (PID: %d)", name, pid)
+
+                if self.handle:
+                    shared = get_shared_page_fraction(pid)
+                    self.mapped_heavy = shared is not None and shared > SHARED_PAGE_THRESHOLD
+                    if self.mapped_heavy:
+                        logger.info("%s (PID: %d) is %.0f%% shared pages; throttling working set trims",
+                                    name, pid, shared * 100)
+
+            handle = self.handle
+            mem = None
             if handle:
-                try:
-                    # Empty working set
-                    SetProcessWorkingSetSize(handle, -1, -1)
-                    time.sleep(0.1)
-
-                    # Set new working set size
+                # Set new working set size (the call is synchronous, no need to wait on it)
+                if not self.hard_limited:
                     SetProcessWorkingSetSize(handle, 0, max_memory)
 
-                    # Trim working set
-                    ctypes.windll.psapi.EmptyWorkingSet(handle)
-                finally:
-                    CloseHandle(handle)
-
-            # Force garbage collection
-            gc.collect()
-            # Get current memory usage
-            mem = process.memory_info()
-            ram_usage = (mem.rss / total_ram) * 100
-            working_set = (mem.wset / total_ram) * 100
-            private_usage = (mem.private / total_ram) * 100
-
-            log_message = (f"{process_color}{name.upper()}: "
-                           f"RAM usage (RSS): {ram_usage:.2f}% | {mem.rss / (1024 * 1024):.2f} MB, "
-                           f"Working Set: {working_set:.2f}% | {mem.wset / (1024 * 1024):.2f} MB, "
-                           f"Private Usage: {private_usage:.2f}% | {mem.private / (1024 * 1024):.2f} MB "
-                           f"(Limited to {max_memory_percent}%){Style.RESET_ALL}")
-            print(log_message)
-            logging.info(log_message)
+                # Read current memory usage straight from the handle we already hold
+                mem = get_process_memory(handle)
+                if mem is None and ctypes.get_last_error() == ERROR_INVALID_HANDLE:
+                    # The cached handle went stale; drop it so the next tick reopens it
+                    self._release_handle()
+                    handle = None
+
+                # Trim working set only if the new size alone didn't bring it under target;
+                # a hard cap is enforced by the kernel, so there's nothing to re-trim then
+                elif not self.hard_limited and (mem is None or mem.wset > max_memory):
+                    if self._empty_working_set(handle):
+                        mem = get_process_memory(handle)
+
+            # Fall back to psutil when the handle could not be opened or queried
+            if mem is None:
+                with process.oneshot():
+                    mem = process.memory_info()
+            rss, wset, private = mem.rss, mem.wset, mem.private
+            pct, inv_mb = _PCT_PER_BYTE, _INV_MB
+            ram_usage = rss * pct
+            working_set = wset * pct
+            private_usage = private * pct
+
+            rss_mb = rss * inv_mb
+            wset_mb = wset * inv_mb
+            private_mb = private * inv_mb
+            print(USAGE_DISPLAY_FORMAT % (self.display_prefix, ram_usage, rss_mb, working_set, wset_mb,
+                                          private_usage, private_mb, self.display_suffix))
+            logger.info(USAGE_LOG_FORMAT, self.upper_name, ram_usage, rss_mb, working_set, wset_mb,
+                        private_usage, private_mb, self.max_memory_percent)
 
             # If the process is using more than the limit, try to reduce it more aggressively
-            if ram_usage > max_memory_percent:
+            if ram_usage > self.max_memory_percent:
                 print(f"{Fore.RED}Attempting to reduce {name} memory usage more aggressively...{Style.RESET_ALL}")
                 if handle:
-                    try:
-                        SetProcessWorkingSetSize(handle, 0, max_memory // 2)  # Set to half of max_memory
-                        ctypes.windll.psapi.EmptyWorkingSet(handle)
-                    finally:
-                        CloseHandle(handle)
-
-                # Try to free up memory by calling the garbage collector multiple times
-                for _ in range(3):
-                    gc.collect()
+                    # A hard cap keeps its flags across calls, so halving it here would stick
+                    if not self.hard_limited:
+                        # Halve max_memory, but never below the measured hot set, so the
+                        # process isn't squeezed into constant soft faults
+                        floor = max(AGGRESSIVE_MIN_WORKING_SET, int(mem.rss * HOT_SET_FRACTION))
+                        target = max_memory // 2
+                        if target < floor:
+                            logger.info("Clamped %s working set shrink from %.2f MB to %.2f MB",
+                                        name, target * _INV_MB, floor * _INV_MB)
+                            target = floor
+                        SetProcessWorkingSetSize(handle, 0, target)
+                    self._empty_working_set(handle)
+        except psutil.NoSuchProcess:
+            # The process exited between lookups; have the registry find its replacement
+            self.process = None
+            if self.registry:
+                self.registry.discard(name, pid)
+                self.registry.request_refresh()
         except Exception as ex:
-            error_message = f"{Fore.RED}Error limiting RAM for {name}: {str(ex)}{Style.RESET_ALL}"
-            print(error_message)
-            logging.error(error_message)
+            print(f"{Fore.RED}Error limiting RAM for {name}: {str(ex)}{Style.RESET_ALL}")
+            logger.error("Error limiting RAM for %s: %s", name, ex)
 
-        time.sleep(interval)
+def limit_ram_for_process(name, interval, max_memory_percent=75, registry=None, stop_event=None):
+    """Limit name every interval seconds until stop_event (a threading.Event) is set"""
+    limiter = ProcessLimiter(name, max_memory_percent, registry)
+    try:
+        while True:
+            limiter.tick()
+            if stop_event is None:
+                time.sleep(interval)
+            elif stop_event.wait(interval):
+                break
+    finally:
+        limiter.close()
+
+def get_memory_status():
+    """Fill the shared MEMORYSTATUSEX buffer, or return None if the call fails"""
+    if not GlobalMemoryStatusEx(ctypes.byref(_MEMORY_STATUS)):
+        return None
+    return _MEMORY_STATUS
 
 def print_system_memory():
-    mem = psutil.virtual_memory()
-    print(f"\n{Fore.GREEN}System Memory: {mem.percent}% used | {mem.used / (1024 * 1024):.2f} MB used | {mem.available / (1024 * 1024):.2f} MB available{Style.RESET_ALL}")
-
-def custom_ram_limiter(process_names, interval, max_memory_percent):
-    for name in process_names:
-        threading.Thread(target=limit_ram_for_process, args=(name, interval, max_memory_percent), daemon=True).start()
+    with _MEMORY_STATUS_LOCK:
+        status = get_memory_status()
+        if status is None:
+            mem = psutil.virtual_memory()
+            percent, used, available = mem.percent, mem.used, mem.available
+        else:
+            available = status.ullAvailPhys
+            used = status.ullTotalPhys - available
+            percent = round(used * 100.0 / status.ullTotalPhys, 1)
+    print(f"\n{Fore.GREEN}System Memory: {percent}% used | {used * _INV_MB:.2f} MB used | {available * _INV_MB:.2f} MB available{Style.RESET_ALL}")
 
+async def _monitor_process(limiter, interval):
     try:
         while True:
-            time.sleep(10)  # Print system memory every 10 seconds
-            print_system_memory()
+            # psutil and the Windows calls block, so run the tick off the event loop
+            await asyncio.to_thread(limiter.tick)
+            await asyncio.sleep(interval)
+    finally:
+        limiter.close()
+
+async def _report_system_memory():
+    while True:
+        await asyncio.sleep(10)  # Print system memory every 10 seconds
+        print_system_memory()
+
+async def _run_limiters(process_names, interval, max_memory_percent):
+    # One scanner thread serves every monitored name
+    registry = ProcessRegistry(process_names)
+    registry.start(interval)
+
+    # Ticks run through to_thread; cap its pool so many names can't fan out into
+    # many threads all waking at once (asyncio.run shuts this executor down)
+    workers = max(1, min(len(process_names), os.cpu_count() or 1))
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=workers, thread_name_prefix="limiter"))
+
+    limiters = [ProcessLimiter(name, max_memory_percent, registry) for name in process_names]
+    await asyncio.gather(_report_system_memory(),
+                         *(_monitor_process(limiter, interval) for limiter in limiters))
+
+def custom_ram_limiter(process_names, interval, max_memory_percent):
+    try:
+        asyncio.run(_run_limiters(process_names, interval, max_memory_percent))
     except KeyboardInterrupt:
         print("\nStopping RAM limiting...")
 
+# Built once and written in a single call each time the menu is shown
+_MENU = (f"\n{Fore.CYAN}RAM Limiter Menu:{Style.RESET_ALL}\n"
+         "1. Limit Discord\n"
+         "2. Limit Chrome\n"
+         "3. Limit OBS\n"
+         "4. Limit Visual Studio Code\n"
+         "5. Limit Discord & Chrome\n"
+         "6. Limit Custom Process\n"
+         "7. Enable Game Mode\n"
+         "0. Exit\n")
+_MENU_PROMPT = f"{Fore.GREEN}Enter your choice (0-7): {Style.RESET_ALL}"
+
 def interactive_menu():
     while True:
-        print(f"\n{Fore.CYAN}RAM Limiter Menu:{Style.RESET_ALL}")
-        print("1. Limit Discord")
-        print("2. Limit Chrome")
-        print("3. Limit OBS")
-        print("4. Limit Visual Studio Code")
-        print("5. Limit Discord & Chrome")
-        print("6. Limit Custom Process")
-        print("7. Enable Game Mode")
-        print("0. Exit")
-
-        choice = input(f"{Fore.GREEN}Enter your choice (0-7): {Style.RESET_ALL}")
+        sys.stdout.write(_MENU)
+        sys.stdout.flush()
+
+        choice = input(_MENU_PROMPT)
 
         if choice == '0':
             print("Exiting RAM Limiter...")
@@ -242,12 +921,14 @@ def print_animated_welcome():
     description = "Optimize your system's memory usage for better performance!"
     colors = [Fore.RED, Fore.YELLOW, Fore.GREEN, Fore.CYAN, Fore.BLUE, Fore.MAGENTA]
 
-    # Print the ASCII art welcome message
-    for i, char in enumerate(welcome_message):
-        color = colors[i % len(colors)]
-        sys.stdout.write(f"{color}{char}{Style.RESET_ALL}")
+    # Print the ASCII art welcome message: colour it once, then write it a chunk
+    # at a time (one write + flush + sleep per chunk instead of per character)
+    colored = [colors[i % len(colors)] + char for i, char in enumerate(welcome_message)]
+    for start in range(0, len(colored), WELCOME_CHUNK_SIZE):
+        sys.stdout.write(''.join(colored[start:start + WELCOME_CHUNK_SIZE]))
         sys.stdout.flush()
-        time.sleep(0.001)  # Faster animation for the large text
+        time.sleep(0.001 * WELCOME_CHUNK_SIZE)  # Faster animation for the large text
+    sys.stdout.write(Style.RESET_ALL)
 
     # Print the description
     print(f"\n{Fore.WHITE}{Style.BRIGHT}{description}{Style.RESET_ALL}")
@@ -259,6 +940,10 @@ def main():
     print_animated_welcome()
     setup_logging()
 
+    if not is_admin():
+        print(f"{Fore.YELLOW}Not running as administrator: some processes may not be limited.{Style.RESET_ALL}")
+        logger.warning("Not running as administrator")
+
     parser = argparse.ArgumentParser(description="RAM Limiter CLI")
     parser.add_argument("--discord", action="store_true", help="Limit Discord RAM usage")
     parser.add_argument("--chrome", action="store_true", help="Limit Chrome RAM usage")
@@ -307,10 +992,13 @@ def main():
 
 
 def memory_hog():
-    # Allocate a large list to consume memory
-    large_list = [0] * (1024 * 1024 * 100)  # Allocate about 800 MB
+    # Allocate one contiguous, zero-filled buffer so every page is actually resident,
+    # and free it now and then so the limiter also sees usage drop
     while True:
-        time.sleep(1)
+        buffer = array.array('q', [0]) * (MEMORY_HOG_BYTES // 8)  # About 800 MB
+        time.sleep(MEMORY_HOG_HOLD)
+        del buffer
+        time.sleep(MEMORY_HOG_RELEASE)
 
 if __name__ == "__main__":
     main()
@@ -5,12 +5,17 @@ os.environ['PYQTGRAPH_QT_LIB'] = 'PyQt5'
 import sys
 import time
 import json
+import copy
+import csv
+import gzip
+import io
+import atexit
+import bisect
 import psutil
 import ctypes
 import argparse
 import threading
 import logging
-import gc
 import platform
 import socket
 import hashlib
@@ -18,7 +23,9 @@ import subprocess
 import webbrowser
 from datetime import datetime, timedelta
 from collections import deque
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Dict, List, Optional, Set, Tuple, Any, Mapping
+from types import MappingProxyType
+from dataclasses import dataclass
 from enum import Enum, auto
 from ctypes import wintypes
 from colorama import init, Fore, Back, Style
@@ -29,8 +36,10 @@ from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QP
                             QLabel, QTextEdit, QGroupBox, QSystemTrayIcon, QMenu, QAction, QFileDialog,
                             QMessageBox, QGridLayout, QProgressBar, QInputDialog, QComboBox, QSlider,
                             QTabWidget, QStackedWidget, QListWidget, QListWidgetItem, QAbstractItemView,
-                            QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QFormLayout, QSpinBox)
-from PyQt5.QtCore import QThread, pyqtSignal, Qt, QTimer, QDateTime, QSize, QMetaType
+                            QTableWidget, QTableWidgetItem, QHeaderView, QDialog, QFormLayout, QSpinBox,
+                            QListView, QTableView)
+from PyQt5.QtCore import (QThread, QObject, QCoreApplication, pyqtSignal, Qt, QTimer, QDateTime, QSize, QMetaType,
+                          QAbstractListModel, QAbstractTableModel, QModelIndex, QRunnable, QThreadPool)
 
 # Import sip to register metatypes BEFORE pyqtgraph import
 try:
@@ -45,6 +54,12 @@ import pyqtgraph as pg
 # Configure pyqtgraph to avoid threading issues
 pg.setConfigOptions(useOpenGL=False, antialias=True, exitCleanup=False)
 
+# Optional faster JSON encoder for the config file and exports
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Windows-specific imports (only available on Windows)
 if platform.system() == 'Windows':
     try:
@@ -61,7 +76,45 @@ else:
 init(autoreset=True)
 
 # Windows API constants
-PROCESS_ALL_ACCESS = 0x1F0FFF
+PROCESS_SET_QUOTA = 0x0100
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+# Minimum rights SetProcessWorkingSetSize needs
+PROCESS_LIMIT_ACCESS = PROCESS_SET_QUOTA | PROCESS_QUERY_LIMITED_INFORMATION
+# (SIZE_T)-1 for both working set bounds asks Windows to empty the working set
+EMPTY_WORKING_SET = ctypes.c_size_t(-1).value
+
+# Windows API functions, bound once with explicit signatures so SIZE_T and HANDLE
+# arguments are passed at full width
+if platform.system() == 'Windows':
+    kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    OpenProcess = kernel32.OpenProcess
+    OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    OpenProcess.restype = wintypes.HANDLE
+    CloseHandle = kernel32.CloseHandle
+    CloseHandle.argtypes = [wintypes.HANDLE]
+    CloseHandle.restype = wintypes.BOOL
+    SetProcessWorkingSetSize = kernel32.SetProcessWorkingSetSize
+    SetProcessWorkingSetSize.argtypes = [wintypes.HANDLE, ctypes.c_size_t, ctypes.c_size_t]
+    SetProcessWorkingSetSize.restype = wintypes.BOOL
+else:
+    kernel32 = None
+
+# Processes Game Mode never terminates, whatever the whitelist says
+CRITICAL_PROCESSES = frozenset({
+    'system', 'smss.exe', 'csrss.exe', 'wininit.exe',
+    'services.exe', 'lsass.exe', 'svchost.exe', 'explorer.exe'
+})
+
+# System and launcher processes that are always part of the Game Mode whitelist
+DEFAULT_WHITELIST = frozenset({
+    'explorer.exe', 'system', 'systemd', 'svchost.exe',
+    'csrss.exe', 'winlogon.exe', 'services.exe', 'lsass.exe',
+    'smss.exe', 'wininit.exe', 'taskhost.exe', 'dwm.exe',
+    'ctfmon.exe', 'runtimebroker.exe', 'sihost.exe',
+    'fontdrvhost.exe', 'conhost.exe', 'nvvsvc.exe',
+    'nvidia.exe', 'steam.exe', 'origin.exe', 'epicgameslauncher.exe',
+    'ubisoftconnect.exe', 'battlenet.exe', 'eadesktop.exe'
+})
 
 class MemoryManagementStrategy(Enum):
     AGGRESSIVE = auto()
@@ -100,29 +153,71 @@ class NotificationType(Enum):
     ERROR = "Error"
     SUCCESS = "Success"
 
+# Data points kept per process
+HISTORY_LENGTH = 100
+# Rows in the dashboard's top memory processes table
+TOP_PROCESS_COUNT = 10
+# One history record: monotonic timestamp, memory in MB, CPU %
+HISTORY_DTYPE = np.dtype([('t', np.float64), ('mem', np.float32), ('cpu', np.float32)])
+# Seconds a psutil.virtual_memory() reading is reused by cached_virtual_memory()
+VIRTUAL_MEMORY_TTL = 0.5
+
+# (time.monotonic() of the reading, reading); replaced as a whole so threads never
+# see half an update
+_virtual_memory_cache: Tuple[float, Any] = (0.0, None)
+
+def cached_virtual_memory(ttl: float = VIRTUAL_MEMORY_TTL):
+    """psutil.virtual_memory(), shared by every caller within ttl seconds of the last read"""
+    global _virtual_memory_cache
+    now = time.monotonic()
+    stamp, memory = _virtual_memory_cache
+    if memory is None or now - stamp > ttl:
+        memory = psutil.virtual_memory()
+        _virtual_memory_cache = (now, memory)
+    return memory
+
 class ProcessInfo:
     def __init__(self, pid: int, name: str, memory_usage: float, cpu_usage: float, priority: ProcessPriority = ProcessPriority.NORMAL):
         self.pid = pid
         self.name = name
+        self.name_lower = name.lower()  # for whitelist/priority lookups
         self.memory_usage = memory_usage  # in MB
         self.cpu_usage = cpu_usage  # percentage
         self.priority = priority
-        self.historical_data = deque(maxlen=100)  # Store last 100 data points
-        self.last_updated = datetime.now()
+        # Last HISTORY_LENGTH data points as a ring of 16-byte records
+        self._history = np.zeros(HISTORY_LENGTH, HISTORY_DTYPE)
+        self._head = 0  # next slot to write
+        self._count = 0
+        self.last_updated = time.monotonic()
 
     def update(self, memory_usage: float, cpu_usage: float):
         self.memory_usage = memory_usage
         self.cpu_usage = cpu_usage
-        self.historical_data.append((datetime.now(), memory_usage, cpu_usage))
-        self.last_updated = datetime.now()
+        now = time.monotonic()
+        head = self._head
+        self._history[head] = (now, memory_usage, cpu_usage)
+        self._head = (head + 1) % HISTORY_LENGTH
+        if self._count < HISTORY_LENGTH:
+            self._count += 1
+        self.last_updated = now
 
     def get_memory_trend(self) -> float:
         """Calculate memory usage trend (positive = increasing, negative = decreasing)"""
-        if len(self.historical_data) < 2:
+        if self._count < 2:
             return 0.0
-        old_value = self.historical_data[0][1]
-        new_value = self.historical_data[-1][1]
-        return new_value - old_value
+        mem = self._history['mem']
+        old_value = mem[(self._head - self._count) % HISTORY_LENGTH]
+        new_value = mem[(self._head - 1) % HISTORY_LENGTH]
+        return float(new_value - old_value)
+
+# On Linux, resident set size can be read straight from /proc/<pid>/statm
+_IS_LINUX = platform.system() == 'Linux'
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if _IS_LINUX else 0
+
+def _read_statm_rss(pid: int) -> int:
+    """Resident set size in bytes from /proc/<pid>/statm (its second field, in pages)"""
+    with open(f'/proc/{pid}/statm', 'rb') as f:
+        return int(f.read().split()[1]) * _PAGE_SIZE
 
 class SystemMonitor:
     def __init__(self):
@@ -136,19 +231,40 @@ class SystemMonitor:
             'system_load': [0.0, 0.0, 0.0]  # 1, 5, 15 min averages
         }
         self.process_history = {}
+        # PIDs of the TOP_PROCESS_COUNT processes using the most memory, largest first
+        self.top_memory_pids: Tuple[int, ...] = ()
+        # Sorted distinct names of the running processes; republished only when a name
+        # appears or disappears. _pids_by_name holds the running PIDs behind each name
+        self.process_names: Tuple[str, ...] = ()
+        self._sorted_names: List[str] = []
+        self._pids_by_name: Dict[str, Set[int]] = {}
+        # psutil.Process handles reused across ticks; cpu_percent(interval=None) measures
+        # the delta since the previous call on the same handle
+        self._proc_cache: Dict[int, psutil.Process] = {}
         self.start_time = datetime.now()
+        # Bumped after every update_system_info(); threads sharing this monitor wait on it
+        # instead of scanning the process table themselves
+        self.update_count = 0
+        self._updated = threading.Condition()
         self.uptime = timedelta(0)
+        # Fixed for the lifetime of the process, so read once instead of every refresh
+        self.cpu_cores = psutil.cpu_count()
+        cpu_freq = psutil.cpu_freq()
+        self.cpu_frequency = cpu_freq._asdict() if cpu_freq else None
+        self._boot_timestamp = psutil.boot_time()
+        self.boot_time = datetime.fromtimestamp(self._boot_timestamp)
+        # Prime the system-wide CPU counter: each non-blocking cpu_percent() call reports usage
+        # since the previous one (so the very first reading is 0.0)
+        psutil.cpu_percent(interval=None)
 
     def update_system_info(self):
         """Update comprehensive system information"""
         try:
             # CPU Information
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            cpu_freq = psutil.cpu_freq()
-            cpu_count = psutil.cpu_count()
+            cpu_percent = psutil.cpu_percent(interval=None)  # Usage since the last refresh
 
             # Memory Information
-            memory = psutil.virtual_memory()
+            memory = cached_virtual_memory()
             swap = psutil.swap_memory()
 
             # Disk Information
@@ -158,15 +274,16 @@ class SystemMonitor:
             # Network Information
             net_io = psutil.net_io_counters()
 
-            # System Information
-            boot_time = datetime.fromtimestamp(psutil.boot_time())
-            self.uptime = datetime.now() - boot_time
+            # System Information (the boot time was read once, with the CPU details)
+            self.uptime = timedelta(seconds=time.time() - self._boot_timestamp)
 
-            # Update system info
-            self.system_info.update({
+            # Build a new dict rather than mutating the published one, which other
+            # threads may be reading
+            system_info = dict(self.system_info)
+            system_info.update({
                 'cpu_usage': cpu_percent,
-                'cpu_frequency': cpu_freq._asdict() if cpu_freq else None,
-                'cpu_cores': cpu_count,
+                'cpu_frequency': self.cpu_frequency,
+                'cpu_cores': self.cpu_cores,
                 'memory_usage': memory.percent,
                 'memory_total': memory.total,
                 'memory_used': memory.used,
@@ -178,92 +295,232 @@ class SystemMonitor:
                 'disk_free': disk_usage.free,
                 'network_sent': net_io.bytes_sent,
                 'network_received': net_io.bytes_recv,
-                'boot_time': boot_time,
-                'process_count': len(list(psutil.process_iter()))
+                'boot_time': self.boot_time
             })
 
             # Update process information
-            self._update_process_info()
+            process_count = self._update_process_info()
+            if process_count is not None:
+                system_info['process_count'] = process_count
+
+            self.system_info = system_info
 
         except Exception as e:
             logging.error(f"Error updating system info: {e}")
 
-    def _update_process_info(self):
-        """Update information about running processes"""
+        with self._updated:
+            self.update_count += 1
+            self._updated.notify_all()
+
+    def wait_for_update(self, last_seen: int, timeout: float) -> int:
+        """Wait until the data is newer than update number last_seen; returns the current number"""
+        with self._updated:
+            self._updated.wait_for(lambda: self.update_count != last_seen, timeout)
+            return self.update_count
+
+    def _update_process_info(self) -> Optional[int]:
+        """Update information about running processes; returns the number of running processes"""
         try:
-            current_pids = set()
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
+            current_pids = set(psutil.pids())
+            # Fill a new dict and swap it in at the end, so a dict handed to readers is never
+            # modified afterwards; processes that are gone simply aren't carried over
+            old_history = self.process_history
+            process_history = {}
+            # Parallel arrays of PIDs and memory, for picking the top processes in numpy
+            seen_pids = []
+            seen_memory = []
+            # PIDs now belonging to a different process than in old_history
+            reused_pids = []
+            for pid in current_pids:
+                reused = False
                 try:
-                    pid = proc.info['pid']
-                    current_pids.add(pid)
-                    name = proc.info['name']
-                    memory_mb = proc.info['memory_info'].rss / (1024 * 1024)
-                    cpu_percent = proc.cpu_percent(interval=0.1)
-
-                    if pid not in self.process_history:
-                        self.process_history[pid] = ProcessInfo(pid, name, memory_mb, cpu_percent)
+                    proc = self._proc_cache.get(pid)
+                    if proc is None:
+                        proc = self._proc_cache[pid] = psutil.Process(pid)
+                    elif not proc.is_running():
+                        # is_running() compares creation times, so this is a reused PID: the
+                        # handle's CPU times and the old ProcessInfo (name, priority) belong to
+                        # the exited process, so start over
+                        reused = True
+                        proc = self._proc_cache[pid] = psutil.Process(pid)
+
+                    # Read everything in one batch; the first cpu_percent() call on a new
+                    # handle returns 0.0, later ones the usage since the previous tick
+                    with proc.oneshot():
+                        name = proc.name()
+                        rss = None
+                        if _IS_LINUX:
+                            try:
+                                rss = _read_statm_rss(pid)
+                            except (OSError, ValueError, IndexError):
+                                pass
+                        if rss is None:
+                            rss = proc.memory_info().rss
+                        memory_mb = rss / (1024 * 1024)
+                        cpu_percent = proc.cpu_percent(interval=None)
+
+                    proc_info = None if reused else old_history.get(pid)
+                    if proc_info is None:
+                        proc_info = ProcessInfo(pid, name, memory_mb, cpu_percent)
                     else:
-                        self.process_history[pid].update(memory_mb, cpu_percent)
-
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                        proc_info.update(memory_mb, cpu_percent)
+                    process_history[pid] = proc_info
+                    seen_pids.append(pid)
+                    seen_memory.append(memory_mb)
+                    if reused and pid in old_history:
+                        reused_pids.append(pid)
+
+                except psutil.NoSuchProcess:
+                    self._proc_cache.pop(pid, None)
+                    continue
+                except psutil.AccessDenied:
+                    # Keep what we knew about it until it exits
+                    if pid in old_history and not reused:
+                        process_history[pid] = old_history[pid]
+                        seen_pids.append(pid)
+                        seen_memory.append(old_history[pid].memory_usage)
                     continue
 
-            # Remove processes that no longer exist
-            for pid in list(self.process_history.keys()):
+            self.top_memory_pids = self._top_memory_pids(seen_pids, seen_memory)
+            self._update_process_names(old_history, process_history, reused_pids)
+            self.process_history = process_history
+            for pid in list(self._proc_cache.keys()):
                 if pid not in current_pids:
-                    del self.process_history[pid]
+                    del self._proc_cache[pid]
+
+            # Count from the same enumeration instead of walking the process table again
+            return len(current_pids)
 
         except Exception as e:
             logging.error(f"Error updating process info: {e}")
+            return None
+
+    def _update_process_names(self, old_history: Dict[int, ProcessInfo], process_history: Dict[int, ProcessInfo],
+                              reused_pids: List[int]):
+        """Apply started/exited processes to the sorted name list.
+
+        A reused PID counts as its old process exiting and a new one starting.
+        """
+        names_changed = False
+        pids_by_name = self._pids_by_name
+        # Removals first, so a PID reused under the same name ends up back in the index
+        for pid in (old_history.keys() - process_history.keys()).union(reused_pids):
+            name = old_history[pid].name
+            pids = pids_by_name[name]
+            pids.discard(pid)
+            if not pids:
+                del pids_by_name[name]
+                del self._sorted_names[bisect.bisect_left(self._sorted_names, name)]
+                names_changed = True
+        for pid in (process_history.keys() - old_history.keys()).union(reused_pids):
+            name = process_history[pid].name
+            pids = pids_by_name.get(name)
+            if pids is None:
+                pids = pids_by_name[name] = set()
+                bisect.insort(self._sorted_names, name)
+                names_changed = True
+            pids.add(pid)
+        if names_changed:
+            self.process_names = tuple(self._sorted_names)
+
+    def pids_for_name(self, name: str) -> Tuple[int, ...]:
+        """PIDs of the running processes called name, as of the last refresh"""
+        # Copied to a tuple so the caller may be on another thread than the refresh
+        return tuple(self._pids_by_name.get(name, ()))
+
+    @staticmethod
+    def _top_memory_pids(pids: List[int], memory: List[float]) -> Tuple[int, ...]:
+        """PIDs of the TOP_PROCESS_COUNT largest memory values, largest first"""
+        count = min(TOP_PROCESS_COUNT, len(pids))
+        if count == 0:
+            return ()
+        memory = np.array(memory, np.float32)
+        top = np.argpartition(memory, -count)[-count:]  # unordered top entries, in O(n)
+        top = top[np.argsort(-memory[top])]
+        return tuple(np.array(pids, np.int64)[top].tolist())
+
+    def get_process_handle(self, pid: int) -> Optional[psutil.Process]:
+        """Cached psutil.Process for a PID seen in the last refresh, or None if it's gone"""
+        return self._proc_cache.get(pid)
 
     def get_system_health(self) -> SystemHealthStatus:
         """Calculate overall system health based on multiple factors"""
+        return _HEALTH_BUCKETS[self.get_health_bucket()]
+
+    def get_health_bucket(self) -> int:
+        """System health as an index into _HEALTH_BUCKETS (0 = critical ... 4 = excellent)"""
         try:
-            # Calculate health score (0-100)
-            health_score = 100
-
-            # CPU impact (0-30 points)
-            cpu_impact = min(self.system_info['cpu_usage'] * 0.3, 30)
-            health_score -= cpu_impact
-
-            # Memory impact (0-30 points)
-            memory_impact = min(self.system_info['memory_usage'] * 0.3, 30)
-            health_score -= memory_impact
-
-            # Disk impact (0-20 points)
-            disk_impact = min(self.system_info['disk_usage'] * 0.2, 20)
-            health_score -= disk_impact
-
-            # Process count impact (0-20 points)
-            process_impact = min((self.system_info['process_count'] / 200) * 20, 20)
-            health_score -= process_impact
-
-            # Determine health status
-            if health_score >= 80:
-                return SystemHealthStatus.EXCELLENT
-            elif health_score >= 60:
-                return SystemHealthStatus.GOOD
-            elif health_score >= 40:
-                return SystemHealthStatus.FAIR
-            elif health_score >= 20:
-                return SystemHealthStatus.POOR
-            else:
-                return SystemHealthStatus.CRITICAL
+            info = self.system_info
+            return _health_bucket(info['cpu_usage'], info['memory_usage'],
+                                  info['disk_usage'], info['process_count'])
 
         except Exception as e:
             logging.error(f"Error calculating system health: {e}")
-            return SystemHealthStatus.FAIR
+            return 2  # fair
+
+# Indexed by _health_bucket()
+_HEALTH_BUCKETS = (SystemHealthStatus.CRITICAL, SystemHealthStatus.POOR, SystemHealthStatus.FAIR,
+                   SystemHealthStatus.GOOD, SystemHealthStatus.EXCELLENT)
+
+def _health_bucket(cpu: float, memory: float, disk: float, process_count: int) -> int:
+    """Score system health from 0-100 and return its bucket (0 = critical ... 4 = excellent)"""
+    health_score = (100.0
+                    - min(cpu * 0.3, 30.0)  # CPU impact (0-30 points)
+                    - min(memory * 0.3, 30.0)  # Memory impact (0-30 points)
+                    - min(disk * 0.2, 20.0)  # Disk impact (0-20 points)
+                    - min(process_count * 0.1, 20.0))  # Process count impact (0-20 points)
+    if health_score >= 80:
+        return 4
+    elif health_score >= 60:
+        return 3
+    elif health_score >= 40:
+        return 2
+    elif health_score >= 20:
+        return 1
+    return 0
+
+@dataclass(frozen=True)
+class MonitoringSnapshot:
+    """Read-only view of one SystemMonitor refresh.
+
+    SystemMonitor swaps in new system_info/process_history dicts on every
+    refresh instead of modifying them, so these can wrap the dicts directly
+    rather than copying them. The ProcessInfo objects are still shared.
+    """
+    system_info: Mapping[str, Any]
+    process_history: Mapping[int, ProcessInfo]
+    top_memory_pids: Tuple[int, ...] = ()
+    process_names: Tuple[str, ...] = ()
 
 class MonitoringWorker(QThread):
     """Background worker thread for system monitoring - collects data and emits signals"""
-    data_ready = pyqtSignal(dict, dict)  # system_info, process_history
+    # MonitoringSnapshot; only emitted when the previous snapshot has been taken, so
+    # a busy GUI thread gets at most one queued signal
+    data_ready = pyqtSignal(object)
     
-    def __init__(self, refresh_interval=2):
+    def __init__(self, refresh_interval=2, system_monitor: Optional[SystemMonitor] = None):
         super().__init__()
         self.refresh_interval = refresh_interval
         self.running = True
-        self.system_monitor = SystemMonitor()
+        # The only thread that refreshes this monitor; other components may share it
+        self.system_monitor = system_monitor or SystemMonitor()
+        # Newest snapshot not yet taken by the GUI
+        self.latest_snapshot: Optional[MonitoringSnapshot] = None
+        self._snapshot_lock = threading.Lock()
     
+    def take_snapshot(self) -> Optional[MonitoringSnapshot]:
+        """Return the newest snapshot (None if already taken) and re-arm data_ready"""
+        with self._snapshot_lock:
+            snapshot, self.latest_snapshot = self.latest_snapshot, None
+        return snapshot
+
+    def _publish(self, snapshot: MonitoringSnapshot):
+        with self._snapshot_lock:
+            notify = self.latest_snapshot is None
+            self.latest_snapshot = snapshot
+        if notify:
+            self.data_ready.emit(snapshot)
+
     def run(self):
         """Main worker loop - runs in background thread"""
         while self.running:
@@ -271,11 +528,13 @@ class MonitoringWorker(QThread):
                 # Collect data in background thread (this is the heavy work)
                 self.system_monitor.update_system_info()
                 
-                # Emit signal with collected data (Qt handles thread-safe delivery)
-                self.data_ready.emit(
-                    self.system_monitor.system_info.copy(),
-                    dict(self.system_monitor.process_history)
-                )
+                # Publish the collected data (Qt handles thread-safe delivery of the signal)
+                self._publish(MonitoringSnapshot(
+                    MappingProxyType(self.system_monitor.system_info),
+                    MappingProxyType(self.system_monitor.process_history),
+                    self.system_monitor.top_memory_pids,
+                    self.system_monitor.process_names
+                ))
                 
                 # Sleep in background thread
                 self.msleep(int(self.refresh_interval * 1000))
@@ -294,31 +553,25 @@ class MonitoringWorker(QThread):
         self.refresh_interval = interval
 
 class EnhancedGameMode:
-    def __init__(self, ram_limit_mb: int = 500, whitelist: Optional[List[str]] = None):
+    def __init__(self, ram_limit_mb: int = 500, whitelist: Optional[List[str]] = None,
+                 system_monitor: Optional[SystemMonitor] = None):
         self.ram_limit_mb = ram_limit_mb
-        self.whitelist = whitelist or []
+        self.whitelist = DEFAULT_WHITELIST
         self.running = False
         self.thread = None
         self.performance_profile = PerformanceProfile.BALANCED
         self.aggressiveness = 5  # 1-10 scale
-        self.system_monitor = SystemMonitor()
+        # With a shared monitor, act on its refreshes; otherwise refresh our own
+        self.system_monitor = system_monitor or SystemMonitor()
+        self.owns_monitor = system_monitor is None
         self.notification_callback = None
+        self._pids_with_windows = None
 
-        # Add default system processes to whitelist
-        self._add_default_system_processes()
-
-    def _add_default_system_processes(self):
-        """Add critical system processes to whitelist"""
-        system_processes = [
-            'explorer.exe', 'system', 'systemd', 'svchost.exe',
-            'csrss.exe', 'winlogon.exe', 'services.exe', 'lsass.exe',
-            'smss.exe', 'wininit.exe', 'taskhost.exe', 'dwm.exe',
-            'ctfmon.exe', 'runtimebroker.exe', 'sihost.exe',
-            'fontdrvhost.exe', 'conhost.exe', 'nvvsvc.exe',
-            'nvidia.exe', 'steam.exe', 'origin.exe', 'epicgameslauncher.exe',
-            'ubisoftconnect.exe', 'battlenet.exe', 'eadesktop.exe'
-        ]
-        self.whitelist.extend([p.lower() for p in system_processes if p.lower() not in self.whitelist])
+        self.set_whitelist(whitelist or [])
+
+    def set_whitelist(self, whitelist: List[str]):
+        """Replace the user whitelist; default system processes are always kept"""
+        self.whitelist = DEFAULT_WHITELIST | frozenset(p.lower() for p in whitelist)
 
     def set_performance_profile(self, profile: PerformanceProfile):
         """Set performance profile which affects behavior"""
@@ -367,9 +620,16 @@ class EnhancedGameMode:
 
     def _run(self):
         """Main Game Mode loop"""
+        last_update = self.system_monitor.update_count
         while self.running:
             try:
-                self.system_monitor.update_system_info()
+                if self.owns_monitor:
+                    self.system_monitor.update_system_info()
+                else:
+                    update = self.system_monitor.wait_for_update(last_update, timeout=1.0)
+                    if update == last_update:
+                        continue
+                    last_update = update
 
                 # Get current system health
                 health_status = self.system_monitor.get_system_health()
@@ -384,9 +644,11 @@ class EnhancedGameMode:
                 # Process management
                 self._manage_processes(current_aggressiveness)
 
-                # Sleep based on aggressiveness (more frequent checks when more aggressive)
-                sleep_time = max(0.5, 3.0 - (current_aggressiveness * 0.25))
-                time.sleep(sleep_time)
+                # Sleep based on aggressiveness (more frequent checks when more aggressive);
+                # a shared monitor already paces us at its refresh interval
+                if self.owns_monitor:
+                    sleep_time = max(0.5, 3.0 - (current_aggressiveness * 0.25))
+                    time.sleep(sleep_time)
 
             except Exception as e:
                 logging.error(f"Error in Game Mode: {e}")
@@ -399,22 +661,23 @@ class EnhancedGameMode:
             effective_limit = self.ram_limit_mb * (0.8 + (aggressiveness * 0.02))
 
             terminated_count = 0
+            # Filled in by _process_has_windows for this tick only
+            self._pids_with_windows = None
 
+            whitelist = self.whitelist
             for pid, proc_info in list(self.system_monitor.process_history.items()):
                 try:
-                    # Skip whitelisted processes
-                    if proc_info.name.lower() in self.whitelist:
-                        continue
-
-                    # Skip system critical processes (extra safety)
-                    if self._is_critical_process(proc_info.name):
+                    # Skip whitelisted and system critical processes (extra safety)
+                    name_lower = proc_info.name_lower
+                    if name_lower in whitelist or name_lower in CRITICAL_PROCESSES:
                         continue
 
                     # Check if process exceeds memory limit
                     if proc_info.memory_usage > effective_limit:
                         try:
+                            # Only processes over the limit need a handle
                             proc = psutil.Process(pid)
-                            proc_name = proc.name()
+                            proc_name = proc_info.name
 
                             # Additional safety checks
                             if self._can_safely_terminate(proc):
@@ -447,17 +710,16 @@ class EnhancedGameMode:
 
     def _is_critical_process(self, process_name: str) -> bool:
         """Check if process is critical and should never be terminated"""
-        critical_processes = [
-            'system', 'smss.exe', 'csrss.exe', 'wininit.exe',
-            'services.exe', 'lsass.exe', 'svchost.exe', 'explorer.exe'
-        ]
-        return process_name.lower() in critical_processes
+        return process_name.lower() in CRITICAL_PROCESSES
 
     def _can_safely_terminate(self, proc: psutil.Process) -> bool:
         """Additional safety checks before terminating a process"""
         try:
-            # Don't terminate processes with high CPU usage (might be important)
-            if proc.cpu_percent(interval=0.1) > 50:
+            # Don't terminate processes with high CPU usage (might be important); use the
+            # usage the monitor already sampled instead of blocking to measure it here
+            proc_info = self.system_monitor.process_history.get(proc.pid)
+            cpu_usage = proc_info.cpu_usage if proc_info else proc.cpu_percent(interval=None)
+            if cpu_usage > 50:
                 return False
 
             # Don't terminate processes that are children of critical processes
@@ -478,23 +740,53 @@ class EnhancedGameMode:
         """Check if process has visible windows (Windows only)"""
         try:
             if platform.system() == 'Windows' and win32gui is not None and win32process is not None:
-
-                def enum_windows_callback(hwnd, result):
-                    _, pid = win32process.GetWindowThreadProcessId(hwnd)
-                    if pid == proc.pid:
-                        result.append(hwnd)
-                    return True
-
-                windows = []
-                win32gui.EnumWindows(enum_windows_callback, windows)
-                return len(windows) > 0
+                # Enumerate top-level windows once per tick, on the first check that needs it
+                if self._pids_with_windows is None:
+                    pids_with_windows = set()
+
+                    def enum_windows_callback(hwnd, result):
+                        _, pid = win32process.GetWindowThreadProcessId(hwnd)
+                        result.add(pid)
+                        return True
+
+                    win32gui.EnumWindows(enum_windows_callback, pids_with_windows)
+                    self._pids_with_windows = pids_with_windows
+                return proc.pid in self._pids_with_windows
             return False
         except Exception:
             return False
 
+# Memory limit (% of total RAM) per optimization strategy and process priority;
+# CRITICAL processes are never limited
+MEMORY_LIMITS = {
+    MemoryManagementStrategy.AGGRESSIVE: {
+        ProcessPriority.CRITICAL: None,  # No limit
+        ProcessPriority.HIGH: 80,
+        ProcessPriority.NORMAL: 50,
+        ProcessPriority.LOW: 30,
+        ProcessPriority.BACKGROUND: 20
+    },
+    MemoryManagementStrategy.BALANCED: {
+        ProcessPriority.CRITICAL: None,
+        ProcessPriority.HIGH: 85,
+        ProcessPriority.NORMAL: 60,
+        ProcessPriority.LOW: 40,
+        ProcessPriority.BACKGROUND: 25
+    },
+    MemoryManagementStrategy.CONSERVATIVE: {
+        ProcessPriority.CRITICAL: None,
+        ProcessPriority.HIGH: 90,
+        ProcessPriority.NORMAL: 70,
+        ProcessPriority.LOW: 50,
+        ProcessPriority.BACKGROUND: 30
+    }
+}
+
 class MemoryOptimizer:
-    def __init__(self):
-        self.system_monitor = SystemMonitor()
+    def __init__(self, system_monitor: Optional[SystemMonitor] = None):
+        # With a shared monitor, act on its refreshes; otherwise refresh our own
+        self.system_monitor = system_monitor or SystemMonitor()
+        self.owns_monitor = system_monitor is None
         self.process_priorities = {}
         self.memory_strategy = MemoryManagementStrategy.BALANCED
         self.optimization_mode = MemoryOptimizationMode.AUTOMATIC
@@ -502,6 +794,9 @@ class MemoryOptimizer:
         self.notification_callback = None
         self.running = False
         self.thread = None
+        # PIDs OpenProcess refused (e.g. other users' processes when not elevated);
+        # skipped until they exit instead of being retried every tick
+        self._denied_pids = set()
 
     def set_memory_strategy(self, strategy: MemoryManagementStrategy):
         self.memory_strategy = strategy
@@ -539,11 +834,20 @@ class MemoryOptimizer:
             )
 
     def _optimization_loop(self):
+        last_update = self.system_monitor.update_count
         while self.running:
             try:
-                self.system_monitor.update_system_info()
+                if self.owns_monitor:
+                    self.system_monitor.update_system_info()
+                else:
+                    update = self.system_monitor.wait_for_update(last_update, timeout=1.0)
+                    if update == last_update:
+                        continue
+                    last_update = update
+
                 self._apply_memory_optimization()
-                time.sleep(2)  # Adjust based on system load
+                if self.owns_monitor:
+                    time.sleep(2)  # Adjust based on system load
 
             except Exception as e:
                 logging.error(f"Error in memory optimization loop: {e}")
@@ -563,9 +867,15 @@ class MemoryOptimizer:
                 effective_strategy = self.memory_strategy
 
             # Apply optimization to processes
-            for pid, proc_info in self.system_monitor.process_history.items():
+            self._denied_pids.intersection_update(self.system_monitor.process_history)
+            for pid, proc_info in list(self.system_monitor.process_history.items()):
+                if pid in self._denied_pids:
+                    continue
                 try:
-                    proc = psutil.Process(pid)
+                    # Reuse the monitor's handle rather than constructing a Process per PID
+                    proc = self.system_monitor.get_process_handle(pid)
+                    if proc is None:
+                        continue
                     self._optimize_process_memory(proc, proc_info, effective_strategy)
 
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
@@ -577,11 +887,10 @@ class MemoryOptimizer:
     def _optimize_process_memory(self, proc: psutil.Process, proc_info: ProcessInfo, strategy: MemoryManagementStrategy):
         """Optimize memory for a specific process"""
         try:
-            process_name = proc.name().lower()
-            priority = self.process_priorities.get(process_name, ProcessPriority.NORMAL)
+            priority = self.process_priorities.get(proc_info.name_lower, ProcessPriority.NORMAL)
 
             # Skip optimization for high priority processes
-            if priority in [ProcessPriority.CRITICAL, ProcessPriority.HIGH]:
+            if priority in (ProcessPriority.CRITICAL, ProcessPriority.HIGH):
                 return
 
             # Get memory limits based on strategy and priority
@@ -591,7 +900,7 @@ class MemoryOptimizer:
                 return
 
             # Calculate target memory usage
-            total_ram = psutil.virtual_memory().total
+            total_ram = cached_virtual_memory().total
             max_memory = int(total_ram * (memory_limit_percent / 100))
 
             # Apply memory optimization
@@ -602,32 +911,7 @@ class MemoryOptimizer:
 
     def _get_memory_limit_for_process(self, priority: ProcessPriority, strategy: MemoryManagementStrategy) -> Optional[float]:
         """Get memory limit percentage based on process priority and optimization strategy"""
-        if strategy == MemoryManagementStrategy.AGGRESSIVE:
-            limits = {
-                ProcessPriority.CRITICAL: None,  # No limit
-                ProcessPriority.HIGH: 80,
-                ProcessPriority.NORMAL: 50,
-                ProcessPriority.LOW: 30,
-                ProcessPriority.BACKGROUND: 20
-            }
-        elif strategy == MemoryManagementStrategy.BALANCED:
-            limits = {
-                ProcessPriority.CRITICAL: None,
-                ProcessPriority.HIGH: 85,
-                ProcessPriority.NORMAL: 60,
-                ProcessPriority.LOW: 40,
-                ProcessPriority.BACKGROUND: 25
-            }
-        else:  # CONSERVATIVE
-            limits = {
-                ProcessPriority.CRITICAL: None,
-                ProcessPriority.HIGH: 90,
-                ProcessPriority.NORMAL: 70,
-                ProcessPriority.LOW: 50,
-                ProcessPriority.BACKGROUND: 30
-            }
-
-        return limits.get(priority)
+        return MEMORY_LIMITS[strategy].get(priority)
 
     def _limit_process_memory(self, proc: psutil.Process, max_memory: int, strategy: MemoryManagementStrategy):
         """Apply memory limits to a process using Windows API"""
@@ -636,189 +920,769 @@ class MemoryOptimizer:
                 return
 
             pid = proc.pid
-            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_ALL_ACCESS, False, pid)
+            handle = OpenProcess(PROCESS_LIMIT_ACCESS, False, pid)
 
             if not handle:
+                self._denied_pids.add(pid)
                 return
 
             try:
                 # Different approaches based on strategy
                 if strategy == MemoryManagementStrategy.AGGRESSIVE:
                     # Empty working set first
-                    ctypes.windll.kernel32.SetProcessWorkingSetSize(handle, -1, -1)
-                    time.sleep(0.1)
+                    SetProcessWorkingSetSize(handle, EMPTY_WORKING_SET, EMPTY_WORKING_SET)
 
                     # Set strict memory limit
-                    ctypes.windll.kernel32.SetProcessWorkingSetSize(handle, 0, max_memory)
-
-                    # Force garbage collection
-                    for _ in range(3):
-                        gc.collect()
-                        time.sleep(0.1)
+                    SetProcessWorkingSetSize(handle, 0, max_memory)
 
                 elif strategy == MemoryManagementStrategy.BALANCED:
                     # More gentle approach
-                    ctypes.windll.kernel32.SetProcessWorkingSetSize(handle, 0, max_memory)
-
-                    # Single garbage collection
-                    gc.collect()
+                    SetProcessWorkingSetSize(handle, 0, max_memory)
 
                 else:  # CONSERVATIVE
                     # Only set limit if process is using significantly more
                     current_memory = proc.memory_info().rss
                     if current_memory > max_memory * 1.5:  # 50% over limit
-                        ctypes.windll.kernel32.SetProcessWorkingSetSize(handle, 0, max_memory)
-                        gc.collect()
+                        SetProcessWorkingSetSize(handle, 0, max_memory)
 
             finally:
-                ctypes.windll.kernel32.CloseHandle(handle)
+                CloseHandle(handle)
 
         except Exception as e:
             logging.error(f"Error limiting memory for process {proc.pid}: {e}")
 
+# Settings used when there's no config file, and to fill in keys missing from one
+DEFAULT_CONFIG = {
+    'version': '2.0',
+    'profiles': {},
+    'default_profile': 'balanced',
+    'process_priorities': {},
+    'game_mode_settings': {
+        'ram_limit': 500,
+        'whitelist': [],
+        'performance_profile': 'balanced'
+    },
+    'notification_settings': {
+        'enabled': True,
+        'sound_enabled': False,
+        'tray_notifications': True,
+        'email_alerts': False,
+        'sms_alerts': False
+    },
+    'ui_settings': {
+        'theme': 'dark',
+        'refresh_interval': 2,
+        'show_advanced_stats': False,
+        # Minimum seconds between redraws of each part of the UI; data still
+        # arrives every refresh_interval
+        'widget_intervals': {
+            'dashboard': 0.25,
+            'process_tables': 1.0,
+            'charts': 0.5,
+            'analytics': 5.0,
+            'alerts': 10.0
+        }
+    },
+    'advanced_settings': {
+        'memory_strategy': 'balanced',
+        'optimization_mode': 'automatic',
+        'learning_enabled': True,
+        'auto_start': False,
+        'start_minimized': False
+    }
+}
+
+# Profile changes within this window are written to disk once
+CONFIG_SAVE_DELAY_MS = 1000
+
 class ConfigurationManager:
     def __init__(self):
-        self.current_config = {
-            'version': '2.0',
-            'profiles': {},
-            'default_profile': 'balanced',
-            'process_priorities': {},
-            'game_mode_settings': {
-                'ram_limit': 500,
-                'whitelist': [],
-                'performance_profile': 'balanced'
-            },
-            'notification_settings': {
-                'enabled': True,
-                'sound_enabled': False,
-                'tray_notifications': True,
-                'email_alerts': False,
-                'sms_alerts': False
-            },
-            'ui_settings': {
-                'theme': 'dark',
-                'refresh_interval': 2,
-                'show_advanced_stats': False
-            },
-            'advanced_settings': {
-                'memory_strategy': 'balanced',
-                'optimization_mode': 'automatic',
-                'learning_enabled': True,
-                'auto_start': False,
-                'start_minimized': False
-            }
-        }
+        self.current_config = copy.deepcopy(DEFAULT_CONFIG)
         self.config_file = 'ram_limiter_config.json'
+        # Set by profile changes awaiting the debounced save; cleared by save_config()
+        self._dirty = False
+        self._save_timer = None
+        # Copy of the config as it is on disk, or None when the file is missing, unreadable
+        # or out of date; save_config() skips the write while current_config equals it
+        self._saved_config = None
         self.load_config()
+        atexit.register(self.flush)
 
     def load_config(self):
+        self._saved_config = None
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                loaded_config = orjson.loads(data) if orjson is not None else json.loads(data)
 
                 # Merge with default config
-                self._deep_update(self.current_config, loaded_config)
-                self._migrate_config()
+                self.current_config = self._migrate_config(loaded_config)
+                # Only a file that migration left unchanged counts as saved
+                if self.current_config == loaded_config:
+                    self._saved_config = copy.deepcopy(self.current_config)
         except Exception as e:
             logging.error(f"Error loading config: {e}")
 
     def save_config(self):
+        self._dirty = False
+        if self.current_config == self._saved_config:
+            return
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.current_config, f, indent=4)
+            if orjson is not None:
+                data = orjson.dumps(self.current_config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.current_config, indent=4).encode('utf-8')
+
+            # Write to a temporary file and swap it in, so a crash mid-write can't
+            # leave a truncated config behind
+            tmp_file = self.config_file + '.tmp'
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, self.config_file)
+            self._saved_config = copy.deepcopy(self.current_config)
         except Exception as e:
             logging.error(f"Error saving config: {e}")
 
     def _deep_update(self, original: dict, update: dict):
-        """Recursively update dictionary"""
-        for key, value in update.items():
-            if isinstance(value, dict) and key in original:
-                self._deep_update(original[key], value)
-            else:
-                original[key] = value
+        """Update dictionary in place, merging nested dicts present in both"""
+        stack = [(original, update)]
+        while stack:
+            original, update = stack.pop()
+            for key, value in update.items():
+                if isinstance(value, dict) and isinstance(original.get(key), dict):
+                    stack.append((original[key], value))
+                else:
+                    original[key] = value
 
-    def _migrate_config(self):
+    def _migrate_config(self, loaded_config: dict) -> dict:
         """Migrate old config formats to new version"""
-        if 'version' not in self.current_config:
-            self.current_config['version'] = '1.0'
-
-        # Add any missing keys from default config
-        self._deep_update(self.current_config, {
-            'version': '2.0',
-            'profiles': self.current_config.get('profiles', {}),
-            'default_profile': self.current_config.get('default_profile', 'balanced'),
-            'process_priorities': self.current_config.get('process_priorities', {}),
-            'game_mode_settings': self.current_config.get('game_mode_settings', {
-                'ram_limit': 500,
-                'whitelist': [],
-                'performance_profile': 'balanced'
-            }),
-            'notification_settings': self.current_config.get('notification_settings', {
-                'enabled': True,
-                'sound_enabled': False,
-                'tray_notifications': True,
-                'email_alerts': False,
-                'sms_alerts': False
-            }),
-            'ui_settings': self.current_config.get('ui_settings', {
-                'theme': 'dark',
-                'refresh_interval': 2,
-                'show_advanced_stats': False
-            }),
-            'advanced_settings': self.current_config.get('advanced_settings', {
-                'memory_strategy': 'balanced',
-                'optimization_mode': 'automatic',
-                'learning_enabled': True,
-                'auto_start': False,
-                'start_minimized': False
-            })
-        })
+        # Start from the defaults so any missing keys are filled in, then apply the loaded values
+        config = copy.deepcopy(DEFAULT_CONFIG)
+        self._deep_update(config, loaded_config)
+        config['version'] = DEFAULT_CONFIG['version']
+        return config
+
+    def schedule_save(self):
+        """Save after CONFIG_SAVE_DELAY_MS, folding further changes in that window into one write.
+
+        The delay needs a Qt event loop on the calling thread; without one the
+        config is saved right away.
+        """
+        self._dirty = True
+        app = QCoreApplication.instance()
+        if app is None or QThread.currentThread() is not app.thread():
+            self.save_config()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.setInterval(CONFIG_SAVE_DELAY_MS)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start()
+
+    def flush(self):
+        """Write any change still waiting for the debounced save"""
+        if self._dirty:
+            self.save_config()
 
     def create_profile(self, profile_name: str, settings: dict):
         self.current_config['profiles'][profile_name] = settings
-        self.save_config()
+        self.schedule_save()
 
     def delete_profile(self, profile_name: str):
-        if profile_name in self.current_config['profiles']:
-            del self.current_config['profiles'][profile_name]
-            self.save_config()
+        profiles = self.current_config['profiles']
+        if profiles.pop(profile_name, None) is not None:
+            self.schedule_save()
 
     def set_default_profile(self, profile_name: str):
         if profile_name in self.current_config['profiles']:
             self.current_config['default_profile'] = profile_name
-            self.save_config()
+            self.schedule_save()
+
+# Notifications arriving within this window are delivered to callbacks as one batch
+NOTIFICATION_BATCH_MS = 100
+# Tray balloons are shown at most once per this window, summarising what arrived in it
+TRAY_BATCH_MS = 1000
+# Monitoring snapshots arriving within one frame are collapsed into a single UI refresh
+MONITORING_COALESCE_MS = 16
+# Tray menu entries as (label, name of the EnhancedRAMLimiterGUI slot); None is a separator
+TRAY_MENU_ITEMS = (
+    ("Show", 'show_normal'),
+    ("Hide", 'hide'),
+    None,
+    ("Optimize Now", 'optimize_now'),
+    ("Toggle Game Mode", 'toggle_game_mode_from_tray'),
+    ("Settings", 'show_settings_tab'),
+    None,
+    ("Exit", 'close'),
+)
+# System alerts fire when a value rises above the first threshold and re-arm only once
+# it has dropped below the second, so a value hovering at the limit alerts once
+ALERT_THRESHOLDS = {
+    'cpu_usage': (90, 80),
+    'memory_usage': (90, 80),
+    'process_count': (200, 180),
+}
+
+class Notification:
+    """One notification; timestamp is time.time() and is only formatted for display"""
+    __slots__ = ('timestamp', 'message', 'type', 'read')
+
+    def __init__(self, timestamp: float, message: str, notification_type: NotificationType, read: bool = False):
+        self.timestamp = timestamp
+        self.message = message
+        self.type = notification_type
+        self.read = read
+
+class NotificationCenter(QObject):
+    """Notification history plus batched delivery to callbacks.
+
+    notify() can be called from any thread. Callbacks run on the thread that
+    owns the NotificationCenter (the GUI thread), once per batch, with every
+    notification queued since the previous batch.
+    """
+    _flush_requested = pyqtSignal()
 
-class NotificationCenter:
     def __init__(self):
+        super().__init__()
         self.notifications = deque(maxlen=100)
+        # The unread subset of self.notifications (same objects, oldest first); both keep the
+        # newest 100, so anything evicted here has been evicted from notifications too
+        self._unread = deque(maxlen=100)
         self.callbacks = []
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(NOTIFICATION_BATCH_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        # Queued onto our own thread when emitted from a worker thread
+        self._flush_requested.connect(self._schedule_flush)
 
     def register_callback(self, callback):
+        """Register callback(batch), where batch is a list of Notification objects, oldest first"""
         self.callbacks.append(callback)
 
     def notify(self, message: str, notification_type: NotificationType = NotificationType.INFO):
-        notification = {
-            'timestamp': datetime.now(),
-            'message': message,
-            'type': notification_type.name,
-            'read': False
-        }
-        self.notifications.append(notification)
+        notification = Notification(time.time(), message, notification_type)
+        with self._pending_lock:
+            self.notifications.append(notification)
+            self._unread.append(notification)
+            first_pending = not self._pending
+            self._pending.append(notification)
+
+        # Only the first notification of a batch needs to arm the timer
+        if first_pending:
+            self._flush_requested.emit()
+
+    def _schedule_flush(self):
+        # Don't restart a running timer, or a steady stream would postpone delivery forever
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush(self):
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return
 
         # Call all registered callbacks
         for callback in self.callbacks:
             try:
-                callback(message, notification_type)
+                callback(batch)
             except Exception as e:
                 logging.error(f"Error in notification callback: {e}")
 
-    def get_unread_notifications(self) -> List[dict]:
-        return [n for n in self.notifications if not n['read']]
+    @property
+    def unread_count(self) -> int:
+        return len(self._unread)
+
+    def get_unread_notifications(self) -> List[Notification]:
+        with self._pending_lock:
+            return list(self._unread)
 
     def mark_all_as_read(self):
-        for notification in self.notifications:
-            notification['read'] = True
+        with self._pending_lock:
+            for notification in self._unread:
+                notification.read = True
+            self._unread.clear()
+
+# Text colour of a notification by type, and of notifications that have been read
+NOTIFICATION_COLORS = {
+    NotificationType.INFO: "#3498db",
+    NotificationType.WARNING: "#f39c12",
+    NotificationType.ERROR: "#e74c3c",
+    NotificationType.SUCCESS: "#2ecc71"
+}
+NOTIFICATION_READ_COLOR = "#95a5a6"
+
+class NotificationListModel(QAbstractListModel):
+    """The newest notifications shown in the notifications tab, newest first.
+
+    Rows are added a batch at a time from NotificationCenter callbacks, and at
+    most max_rows are kept, matching the NotificationCenter history. Rows share
+    the center's Notification objects, so their read flags are the center's.
+    A notification repeating the newest row's message and type is folded into
+    that row as a repeat count instead of adding another row.
+    """
+
+    def __init__(self, max_rows: int = 100, parent=None):
+        super().__init__(parent)
+        self.max_rows = max_rows
+        # [latest Notification, repeat count, its "HH:MM:SS" time] per row, oldest
+        # first so new rows are appended
+        self._rows = deque()
+        # Foreground brushes are built once rather than on every data() call
+        self._foregrounds = {notification_type: QColor(color)
+                             for notification_type, color in NOTIFICATION_COLORS.items()}
+        self._read_foreground = QColor(NOTIFICATION_READ_COLOR)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        notification, count, timestamp = self._rows[-1 - index.row()]
+        if role == Qt.DisplayRole:
+            if count > 1:
+                return f"[{timestamp}] ({count}×) {notification.message}"
+            return f"[{timestamp}] {notification.message}"
+        if role == Qt.ForegroundRole:
+            if notification.read:
+                return self._read_foreground
+            return self._foregrounds.get(notification.type, self._read_foreground)
+        return None
+
+    @staticmethod
+    def _format_time(notification: Notification) -> str:
+        return time.strftime('%H:%M:%S', time.localtime(notification.timestamp))
+
+    def add_batch(self, batch: List[Notification]):
+        newest = self._rows[-1] if self._rows else None
+        top_repeated = False
+        new_rows = []
+        for notification in batch:
+            target = new_rows[-1] if new_rows else newest
+            if (target is not None and target[0].message == notification.message
+                    and target[0].type == notification.type):
+                target[0] = notification
+                target[1] += 1
+                target[2] = self._format_time(notification)
+                top_repeated = top_repeated or target is newest
+            else:
+                new_rows.append([notification, 1, self._format_time(notification)])
+
+        if top_repeated:
+            self.dataChanged.emit(self.index(0), self.index(0))
+        if not new_rows:
+            return
+
+        new_rows = new_rows[-self.max_rows:]
+        overflow = len(self._rows) + len(new_rows) - self.max_rows
+        if overflow > 0:
+            # The oldest rows are at the bottom of the view
+            count = len(self._rows)
+            self.beginRemoveRows(QModelIndex(), count - overflow, count - 1)
+            for _ in range(overflow):
+                self._rows.popleft()
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, len(new_rows) - 1)
+        self._rows.extend(new_rows)
+        self.endInsertRows()
+
+    def refresh_read_state(self):
+        """Repaint after NotificationCenter.mark_all_as_read()"""
+        if self._rows:
+            self.dataChanged.emit(self.index(0), self.index(len(self._rows) - 1), [Qt.ForegroundRole])
+
+    def clear(self):
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+# Byte conversion factors for the dashboard
+_MB_INV = 1.0 / (1024 * 1024)
+_GB_INV = 1.0 / (1024 * 1024 * 1024)
+# system_info values shown on the dashboard, in the order update_dashboard unpacks them
+DASHBOARD_KEYS = ('cpu_usage', 'memory_usage', 'memory_used', 'memory_total', 'memory_available',
+                  'disk_usage', 'disk_used', 'disk_total', 'disk_free', 'network_sent', 'network_received')
+
+# Analytics chart value for each health status, indexed like _HEALTH_BUCKETS
+# (critical, poor, fair, good, excellent)
+HEALTH_SCORES = (10, 25, 50, 75, 100)
+# Health statuses whose light background needs dark indicator text
+DARK_TEXT_HEALTH = frozenset({SystemHealthStatus.EXCELLENT, SystemHealthStatus.GOOD})
+
+# Combo box entries in display order, as enum members and as config keys
+PRIORITY_CHOICES = (ProcessPriority.CRITICAL, ProcessPriority.HIGH, ProcessPriority.NORMAL,
+                    ProcessPriority.LOW, ProcessPriority.BACKGROUND)
+PERFORMANCE_PROFILE_CHOICES = (PerformanceProfile.BALANCED, PerformanceProfile.GAMING,
+                               PerformanceProfile.WORK, PerformanceProfile.BATTERY_SAVER)
+PERFORMANCE_PROFILE_KEYS = ('balanced', 'gaming', 'work', 'battery_saver')
+MEMORY_STRATEGY_KEYS = ('balanced', 'aggressive', 'conservative')
+MEMORY_STRATEGY_CHOICES = (MemoryManagementStrategy.BALANCED, MemoryManagementStrategy.AGGRESSIVE,
+                           MemoryManagementStrategy.CONSERVATIVE)
+OPTIMIZATION_MODE_KEYS = ('automatic', 'manual', 'learning')
+# Combo index of each config key; unknown keys fall back to the first entry
+PERFORMANCE_PROFILE_INDEX = {key: index for index, key in enumerate(PERFORMANCE_PROFILE_KEYS)}
+MEMORY_STRATEGY_INDEX = {key: index for index, key in enumerate(MEMORY_STRATEGY_KEYS)}
+OPTIMIZATION_MODE_INDEX = {key: index for index, key in enumerate(OPTIMIZATION_MODE_KEYS)}
+
+def memory_strategy_for_key(key: str) -> MemoryManagementStrategy:
+    """Strategy for a config key; unknown keys mean balanced, as in the settings combo"""
+    return MEMORY_STRATEGY_CHOICES[MEMORY_STRATEGY_INDEX.get(key.lower(), 0)]
+
+HEALTH_COLORS = {
+    SystemHealthStatus.EXCELLENT: "#2ecc71",
+    SystemHealthStatus.GOOD: "#27ae60",
+    SystemHealthStatus.FAIR: "#f39c12",
+    SystemHealthStatus.POOR: "#e67e22",
+    SystemHealthStatus.CRITICAL: "#e74c3c"
+}
+
+# Application-wide stylesheet, installed once on the QApplication in main(). Widgets
+# with their own look are selected by object name; state changes use dynamic properties
+APP_STYLESHEET = """
+    QTabBar::tab {
+        padding: 8px 16px;
+        background: #3c3c3c;
+        color: #ffffff;
+        border: 1px solid #4a4a4a;
+        border-bottom: none;
+        min-width: 120px;
+    }
+    QTabBar::tab:selected {
+        background: #2ecc71;
+        color: white;
+        font-weight: bold;
+    }
+    QTabBar::tab:hover {
+        background: #4a4a4a;
+    }
+    QTableView {
+        background: #353535;
+        color: #ffffff;
+        border: 1px solid #4a4a4a;
+        gridline-color: #4a4a4a;
+    }
+    QHeaderView::section {
+        background: #3c3c3c;
+        color: #00b4d8;
+        padding: 5px;
+        border: none;
+    }
+    QListWidget, QListView#notificationList {
+        background: #353535;
+        color: #ffffff;
+        border: 1px solid #4a4a4a;
+    }
+    QListView#notificationList::item {
+        padding: 8px;
+        border-bottom: 1px solid #4a4a4a;
+    }
+    QLabel#healthIndicator {
+        font-size: 24px;
+        font-weight: bold;
+        padding: 15px;
+        border-radius: 10px;
+        background: #3c3c3c;
+        color: #ffffff;
+    }
+    QLabel#statValue {
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QLabel#gameModeStatus {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QLabel#gameModeStatus[active="true"] {
+        color: #2ecc71;
+    }
+    QLabel#gameModeStatus[active="false"] {
+        color: #e74c3c;
+    }
+    QPushButton#optimizeNowButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #2ecc71, stop:1 #27ae60);
+        color: white;
+        font-weight: bold;
+        padding: 10px 20px;
+        border-radius: 5px;
+    }
+    QPushButton#optimizeNowButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #27ae60, stop:1 #2ecc71);
+    }
+    QPushButton#autoOptimizeButton {
+        background: #3c3c3c;
+        color: #ffffff;
+        padding: 10px 20px;
+        border-radius: 5px;
+    }
+    QPushButton#autoOptimizeButton:checked {
+        background: #3498db;
+        color: white;
+        font-weight: bold;
+    }
+    QPushButton#terminateButton {
+        background: #e74c3c;
+        color: white;
+    }
+    QPushButton#gameModeToggle {
+        background: #3c3c3c;
+        color: #ffffff;
+        padding: 15px;
+        font-size: 16px;
+        border-radius: 8px;
+    }
+    QPushButton#gameModeToggle:checked {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #e74c3c, stop:1 #c0392b);
+        color: white;
+        font-weight: bold;
+    }
+    QPushButton#saveSettingsButton {
+        background: #2ecc71;
+        color: white;
+        padding: 10px;
+        font-weight: bold;
+        border-radius: 5px;
+    }
+""" + "".join(
+    # One rule per health status, selected through the indicator's "health" property
+    f"""
+    QLabel#healthIndicator[health="{status.name}"] {{
+        background: {color};
+        color: {'#000000' if status in DARK_TEXT_HEALTH else '#ffffff'};
+    }}
+"""
+    for status, color in HEALTH_COLORS.items()
+)
+
+def _restyle(widget: QWidget, name: str, value):
+    """Set a dynamic property used by APP_STYLESHEET and re-apply the style to it"""
+    widget.setProperty(name, value)
+    widget.style().unpolish(widget)
+    widget.style().polish(widget)
+
+# Columns of the process tables: (header, cell text, text alignment or None for the default)
+PROCESS_TABLE_COLUMNS = (
+    ("Process", lambda p: p.name, Qt.AlignLeft | Qt.AlignVCenter),
+    ("PID", lambda p: str(p.pid), Qt.AlignCenter),
+    ("Memory (MB)", lambda p: f"{p.memory_usage:.1f}", Qt.AlignRight),
+    ("CPU (%)", lambda p: f"{p.cpu_usage:.1f}", Qt.AlignRight),
+    ("Priority", lambda p: p.priority.name.capitalize(), Qt.AlignCenter),
+)
+ADVANCED_TABLE_COLUMNS = (
+    ("Process", lambda p: p.name, None),
+    ("PID", lambda p: str(p.pid), Qt.AlignCenter),
+    ("Memory (MB)", lambda p: f"{p.memory_usage:.1f}", Qt.AlignRight),
+    ("CPU (%)", lambda p: f"{p.cpu_usage:.1f}", Qt.AlignRight),
+    ("Threads", lambda p: "N/A", None),  # placeholders for now
+    ("Handles", lambda p: "N/A", None),
+    ("Priority", lambda p: p.priority.name.capitalize(), None),
+    ("Actions", lambda p: "⚙️", Qt.AlignCenter),  # clicking it opens the actions menu
+)
+ADVANCED_ACTIONS_COLUMN = len(ADVANCED_TABLE_COLUMNS) - 1
+# Process table rows have one line of text, so they get a fixed height and the views
+# never measure rows
+PROCESS_TABLE_ROW_HEIGHT = 22
+
+class ProcessTableModel(QAbstractTableModel):
+    """ProcessInfo rows for a QTableView.
+
+    Cell text is formatted in data(), so only cells the view actually paints
+    cost anything; a refresh just swaps row references and emits one signal.
+    """
+
+    def __init__(self, columns, parent=None):
+        super().__init__(parent)
+        self._columns = columns
+        self._rows: List[ProcessInfo] = []
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self._columns[section][0]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, text, alignment = self._columns[index.column()]
+        if role == Qt.DisplayRole:
+            return text(self._rows[index.row()])
+        if role == Qt.TextAlignmentRole and alignment is not None:
+            return int(alignment)
+        return None
+
+    def pid_at(self, row: int) -> Optional[int]:
+        return self._rows[row].pid if 0 <= row < len(self._rows) else None
+
+    def _all_changed(self):
+        if self._rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(len(self._rows) - 1, len(self._columns) - 1))
+
+    def set_ranked(self, processes: List[ProcessInfo]):
+        """Show processes in the given order; rows are ranks, so only the row count is structural"""
+        if len(processes) != len(self._rows):
+            self.beginResetModel()
+            self._rows = list(processes)
+            self.endResetModel()
+        else:
+            self._rows = list(processes)
+            self._all_changed()
+
+    def set_keyed(self, process_history: Mapping[int, ProcessInfo]):
+        """Show every process, keeping each PID on its row; exited ones are removed, new ones appended"""
+        for row in range(len(self._rows) - 1, -1, -1):
+            proc_info = process_history.get(self._rows[row].pid)
+            if proc_info is None:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+            else:
+                self._rows[row] = proc_info
+
+        shown = {proc_info.pid for proc_info in self._rows}
+        added = [proc_info for pid, proc_info in process_history.items() if pid not in shown]
+        if added:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            self._rows.extend(added)
+            self.endInsertRows()
+        self._all_changed()
+
+class ChartHistory:
+    """Fixed-length ring of (timestamp, value, ...) samples backing a pyqtgraph plot"""
+
+    def __init__(self, fields: Tuple[str, ...], length: int = HISTORY_LENGTH):
+        self.fields = fields
+        # Timestamps need float64; the plotted values are percentages and MB, for
+        # which float32 is plenty, stored as one row per field
+        self._times = np.zeros(length, np.float64)
+        self._values = np.zeros((len(fields), length), np.float32)
+        self._length = length
+        self._head = 0  # next column to write
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, *values: float):
+        self._times[self._head] = timestamp
+        self._values[:, self._head] = values
+        self._head = (self._head + 1) % self._length
+        if self._count < self._length:
+            self._count += 1
+
+    def _ordered(self, data: np.ndarray) -> np.ndarray:
+        """Columns of data in chronological order (always a copy)"""
+        if self._count < self._length:
+            return data[..., :self._count].copy()
+        return np.roll(data, -self._head, axis=-1)
+
+    def series(self) -> Tuple[np.ndarray, ...]:
+        """(seconds since the oldest sample, one array per field), in chronological order"""
+        elapsed = self._ordered(self._times)
+        if len(elapsed):
+            elapsed -= elapsed[0]
+        return (elapsed, *self._ordered(self._values))
+
+    def values(self, field: str) -> List[float]:
+        # Rounded so exported numbers don't show float32 noise (55.3, not 55.29999923706055)
+        return self._ordered(self._values[self.fields.index(field)]).astype(np.float64).round(4).tolist()
+
+class IOTaskSignals(QObject):
+    done = pyqtSignal(object)  # return value of the task function
+    error = pyqtSignal(str)
+
+class IOTask(QRunnable):
+    """Run fn(*args) on the global QThreadPool and report back through signals.
+
+    The signals object is created on the calling (GUI) thread, so connected
+    slots run there once the task finishes.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = IOTaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        else:
+            self.signals.done.emit(result)
+
+    def start(self):
+        QThreadPool.globalInstance().start(self)
+
+# Exports to a path ending in .gz are compressed at this (fastest) gzip level
+EXPORT_GZIP_LEVEL = 1
+
+def _write_export_file(encoded: bytes, file_path: str):
+    """Write a fully encoded export in one write, gzip-compressed for .gz paths"""
+    if file_path.endswith('.gz'):
+        with gzip.open(file_path, 'wb', compresslevel=EXPORT_GZIP_LEVEL) as f:
+            f.write(encoded)
+    else:
+        with open(file_path, 'wb') as f:
+            f.write(encoded)
+
+def _write_json_file(data, file_path: str):
+    if orjson is not None:
+        # Analytics exports are keyed by PID, hence OPT_NON_STR_KEYS
+        encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                               | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        encoded = json.dumps(data, indent=4).encode('utf-8')
+    _write_export_file(encoded, file_path)
+
+def _read_profile_file(file_path: str) -> Tuple[str, dict]:
+    """Read an exported profile; returns (name, settings)"""
+    with open(file_path, 'rb') as f:
+        data = json.loads(f.read())
+    if not isinstance(data, dict) or not isinstance(data.get('settings'), dict):
+        raise ValueError(f"{file_path} is not an exported profile")
+    name = str(data.get('name') or os.path.splitext(os.path.basename(file_path))[0])
+    return name, data['settings']
+
+def _limit_process_memory(pids: Tuple[int, ...], limit_percent: int) -> Optional[int]:
+    """Cap the working set of the first live process in pids to limit_percent of RAM.
+
+    Returns the PID that was limited, or None if none of them could be.
+    """
+    max_memory = int(cached_virtual_memory().total * (limit_percent / 100))
+    for pid in pids:
+        try:
+            psutil.Process(pid)
+
+            # Apply memory limit
+            if platform.system() == 'Windows':
+                handle = OpenProcess(PROCESS_LIMIT_ACCESS, False, pid)
+                if handle:
+                    try:
+                        SetProcessWorkingSetSize(handle, 0, max_memory)
+                    finally:
+                        CloseHandle(handle)
+            return pid
+
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return None
 
 class EnhancedRAMLimiterGUI(QWidget):
     def __init__(self):
@@ -826,17 +1690,43 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.setWindowTitle('RAM Limiter Enhanced')
         self.setMinimumSize(1000, 800)
 
-        # Initialize components
+        # Initialize components. The monitoring worker is the only thread that scans
+        # processes; the optimizer and Game Mode act on its shared monitor, while
+        # self.system_monitor holds the last snapshot delivered to the UI
+        self.shared_monitor = SystemMonitor()
         self.system_monitor = SystemMonitor()
-        self.memory_optimizer = MemoryOptimizer()
-        self.game_mode = EnhancedGameMode()
+        self.memory_optimizer = MemoryOptimizer(self.shared_monitor)
+        self.game_mode = EnhancedGameMode(system_monitor=self.shared_monitor)
         self.config_manager = ConfigurationManager()
         self.notification_center = NotificationCenter()
 
+        # The health indicator is restyled only when the status changes, and the
+        # dashboard labels only get setText when their text changes
+        self._last_health = None
+        self._last_dashboard_values = None
+        # Alerts currently raised, see check_system_alerts()
+        self._active_alerts: Set[str] = set()
+        self._label_texts: Dict[QLabel, str] = {}
+        # time.monotonic() of each UI part's last redraw, see _refresh_due()
+        self._last_refresh: Dict[str, float] = {}
+        # process_names tuple the process combo box was last filled from
+        self._combo_names: Optional[Tuple[str, ...]] = None
+        # Analytics history, recorded from startup whether or not the analytics tab is built
+        self.health_scores = ChartHistory(('score',))
+        self.memory_usages = ChartHistory(('memory_mb',))
+        self.process_model = ProcessTableModel(PROCESS_TABLE_COLUMNS, self)
+        self.advanced_process_model = ProcessTableModel(ADVANCED_TABLE_COLUMNS, self)
+        # Notifications waiting for the next tray balloon
+        self._tray_buffer: List[Notification] = []
+        self._tray_timer = QTimer(self)
+        self._tray_timer.setSingleShot(True)
+        self._tray_timer.setInterval(TRAY_BATCH_MS)
+        self._tray_timer.timeout.connect(self._show_tray_summary)
+
         # Connect notification system
         self.memory_optimizer.notification_callback = self.handle_notification
         self.game_mode.notification_callback = self.handle_notification
-        self.notification_center.register_callback(self.show_notification)
+        self.notification_center.register_callback(self.show_notifications)
 
         # Setup UI
         self.init_ui()
@@ -844,9 +1734,14 @@ class EnhancedRAMLimiterGUI(QWidget):
 
         # Start monitoring using background worker thread with signals
         # Worker collects data in background, emits signal to update UI on main thread
+        self._monitoring_timer = QTimer(self)
+        self._monitoring_timer.setSingleShot(True)
+        self._monitoring_timer.setInterval(MONITORING_COALESCE_MS)
+        self._monitoring_timer.timeout.connect(self.apply_monitoring_data)
         refresh_interval = self.config_manager.current_config['ui_settings']['refresh_interval']
-        self.monitoring_worker = MonitoringWorker(refresh_interval)
-        self.monitoring_worker.data_ready.connect(self.on_monitoring_data)
+        self.monitoring_worker = MonitoringWorker(refresh_interval, self.shared_monitor)
+        self.monitoring_worker.data_ready.connect(self.on_monitoring_data,
+                                                 Qt.QueuedConnection | Qt.UniqueConnection)
         self.monitoring_worker.start()
         
         # Store current data for UI access
@@ -868,32 +1763,22 @@ class EnhancedRAMLimiterGUI(QWidget):
 
         # Create tab widget for different sections
         self.tab_widget = QTabWidget()
-        self.tab_widget.setStyleSheet("""
-            QTabBar::tab {
-                padding: 8px 16px;
-                background: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #4a4a4a;
-                border-bottom: none;
-                min-width: 120px;
-            }
-            QTabBar::tab:selected {
-                background: #2ecc71;
-                color: white;
-                font-weight: bold;
-            }
-            QTabBar::tab:hover {
-                background: #4a4a4a;
-            }
-        """)
-
-        # Create tabs
+
+        # Create tabs. The process manager and analytics tabs only hold widgets that
+        # are updated when visible, so they are built the first time they are opened
         self.dashboard_tab = self.create_dashboard_tab()
-        self.process_manager_tab = self.create_process_manager_tab()
+        self.process_manager_tab = self._lazy_tab_placeholder()
         self.game_mode_tab = self.create_game_mode_tab()
         self.settings_tab = self.create_settings_tab()
         self.notifications_tab = self.create_notifications_tab()
-        self.analytics_tab = self.create_analytics_tab()
+        self.analytics_tab = self._lazy_tab_placeholder()
+        self.advanced_process_table = None
+        self.health_curve = None
+        self._tab_builders = {
+            self.process_manager_tab: self.create_process_manager_tab,
+            self.analytics_tab: self.create_analytics_tab
+        }
+        self.tab_widget.currentChanged.connect(self._ensure_tab)
 
         self.tab_widget.addTab(self.dashboard_tab, "📊 Dashboard")
         self.tab_widget.addTab(self.process_manager_tab, "🔧 Process Manager")
@@ -905,6 +1790,22 @@ class EnhancedRAMLimiterGUI(QWidget):
         main_layout.addWidget(self.tab_widget)
         self.setLayout(main_layout)
 
+    @staticmethod
+    def _lazy_tab_placeholder() -> QWidget:
+        """Empty tab page that receives its real contents in _ensure_tab"""
+        placeholder = QWidget()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        placeholder.setLayout(layout)
+        return placeholder
+
+    def _ensure_tab(self, index: int):
+        """Build a lazily created tab the first time it is shown"""
+        placeholder = self.tab_widget.widget(index)
+        builder = self._tab_builders.pop(placeholder, None)
+        if builder is not None:
+            placeholder.layout().addWidget(builder())
+
     def create_dashboard_tab(self):
         """Create the dashboard tab with system overview"""
         dashboard = QWidget()
@@ -914,16 +1815,7 @@ class EnhancedRAMLimiterGUI(QWidget):
 
         # System health indicator
         self.health_indicator = QLabel()
-        self.health_indicator.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                padding: 15px;
-                border-radius: 10px;
-                background: #3c3c3c;
-                color: #ffffff;
-            }
-        """)
+        self.health_indicator.setObjectName("healthIndicator")
         layout.addWidget(self.health_indicator)
 
         # System stats grid
@@ -934,12 +1826,13 @@ class EnhancedRAMLimiterGUI(QWidget):
         cpu_group = QGroupBox("CPU")
         cpu_layout = QVBoxLayout()
         self.cpu_usage_label = QLabel("0%")
-        self.cpu_usage_label.setStyleSheet("font-size: 18px; font-weight: bold;")
-        self.cpu_freq_label = QLabel("0 GHz")
-        self.cpu_cores_label = QLabel("0 cores")
+        self.cpu_usage_label.setObjectName("statValue")
+        # Core count and rated frequency don't change, so their label is set only here
+        cpu_frequency = self.shared_monitor.cpu_frequency
+        frequency_mhz = (cpu_frequency['max'] or cpu_frequency['current']) if cpu_frequency else 0
+        self.cpu_details_label = QLabel(f"{frequency_mhz / 1000:.2f} GHz\n{self.shared_monitor.cpu_cores} cores")
         cpu_layout.addWidget(self.cpu_usage_label)
-        cpu_layout.addWidget(self.cpu_freq_label)
-        cpu_layout.addWidget(self.cpu_cores_label)
+        cpu_layout.addWidget(self.cpu_details_label)
         cpu_group.setLayout(cpu_layout)
         stats_grid.addWidget(cpu_group, 0, 0)
 
@@ -947,12 +1840,12 @@ class EnhancedRAMLimiterGUI(QWidget):
         memory_group = QGroupBox("Memory")
         memory_layout = QVBoxLayout()
         self.memory_usage_label = QLabel("0%")
-        self.memory_usage_label.setStyleSheet("font-size: 18px; font-weight: bold;")
-        self.memory_used_label = QLabel("0/0 MB")
-        self.memory_available_label = QLabel("0 MB available")
+        self.memory_usage_label.setObjectName("statValue")
+        # The secondary lines of each group share one plain-text label, so a tick
+        # updates one widget per group rather than one per line
+        self.memory_details_label = QLabel("0 / 0 GB\n0 GB available")
         memory_layout.addWidget(self.memory_usage_label)
-        memory_layout.addWidget(self.memory_used_label)
-        memory_layout.addWidget(self.memory_available_label)
+        memory_layout.addWidget(self.memory_details_label)
         memory_group.setLayout(memory_layout)
         stats_grid.addWidget(memory_group, 0, 1)
 
@@ -960,24 +1853,18 @@ class EnhancedRAMLimiterGUI(QWidget):
         disk_group = QGroupBox("Disk")
         disk_layout = QVBoxLayout()
         self.disk_usage_label = QLabel("0%")
-        self.disk_usage_label.setStyleSheet("font-size: 18px; font-weight: bold;")
-        self.disk_used_label = QLabel("0/0 GB")
-        self.disk_free_label = QLabel("0 GB free")
+        self.disk_usage_label.setObjectName("statValue")
+        self.disk_details_label = QLabel("0 / 0 GB\n0 GB free")
         disk_layout.addWidget(self.disk_usage_label)
-        disk_layout.addWidget(self.disk_used_label)
-        disk_layout.addWidget(self.disk_free_label)
+        disk_layout.addWidget(self.disk_details_label)
         disk_group.setLayout(disk_layout)
         stats_grid.addWidget(disk_group, 0, 2)
 
         # Network Stats
         network_group = QGroupBox("Network")
         network_layout = QVBoxLayout()
-        self.network_sent_label = QLabel("0 MB sent")
-        self.network_received_label = QLabel("0 MB received")
-        self.network_total_label = QLabel("0 MB total")
-        network_layout.addWidget(self.network_sent_label)
-        network_layout.addWidget(self.network_received_label)
-        network_layout.addWidget(self.network_total_label)
+        self.network_details_label = QLabel("0 MB sent\n0 MB received\n0 MB total")
+        network_layout.addWidget(self.network_details_label)
         network_group.setLayout(network_layout)
         stats_grid.addWidget(network_group, 0, 3)
 
@@ -990,6 +1877,11 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.load_chart.setLabel('left', 'Usage (%)', color='#ffffff')
         self.load_chart.setLabel('bottom', 'Time', color='#ffffff')
         self.load_chart.showGrid(x=True, y=True, alpha=0.3)
+        self.load_chart.setDownsampling(auto=True, mode='peak')
+        self.load_chart.setClipToView(True)
+        # Percent-based chart: fixed y-axis, so pyqtgraph never auto-ranges it
+        self.load_chart.disableAutoRange()
+        self.load_chart.setYRange(0, 100)
 
         # Multiple curves for different metrics
         self.cpu_curve = self.load_chart.plot(pen=pg.mkPen('#3498db', width=2), name="CPU")
@@ -997,49 +1889,19 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.disk_curve = self.load_chart.plot(pen=pg.mkPen('#2ecc71', width=2), name="Disk")
 
         # Store data for charts
-        self.chart_data = {
-            'cpu': deque(maxlen=100),
-            'memory': deque(maxlen=100),
-            'disk': deque(maxlen=100),
-            'timestamps': deque(maxlen=100)
-        }
+        self.chart_data = ChartHistory(('cpu', 'memory', 'disk'))
 
         layout.addWidget(self.load_chart)
 
         # Quick actions
         actions_layout = QHBoxLayout()
         self.optimize_now_btn = QPushButton("⚡ Optimize Now")
-        self.optimize_now_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #2ecc71, stop:1 #27ae60);
-                color: white;
-                font-weight: bold;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #27ae60, stop:1 #2ecc71);
-            }
-        """)
+        self.optimize_now_btn.setObjectName("optimizeNowButton")
         self.optimize_now_btn.clicked.connect(self.optimize_now)
 
         self.toggle_auto_btn = QPushButton("🤖 Auto Optimization: OFF")
         self.toggle_auto_btn.setCheckable(True)
-        self.toggle_auto_btn.setStyleSheet("""
-            QPushButton {
-                background: #3c3c3c;
-                color: #ffffff;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:checked {
-                background: #3498db;
-                color: white;
-                font-weight: bold;
-            }
-        """)
+        self.toggle_auto_btn.setObjectName("autoOptimizeButton")
         self.toggle_auto_btn.clicked.connect(self.toggle_auto_optimization)
 
         actions_layout.addWidget(self.optimize_now_btn)
@@ -1050,27 +1912,14 @@ class EnhancedRAMLimiterGUI(QWidget):
         process_group = QGroupBox("Top Memory Processes")
         process_layout = QVBoxLayout()
 
-        self.process_table = QTableWidget()
-        self.process_table.setColumnCount(5)
-        self.process_table.setHorizontalHeaderLabels(["Process", "PID", "Memory (MB)", "CPU (%)", "Priority"])
+        self.process_table = QTableView()
+        self.process_table.setModel(self.process_model)
         self.process_table.horizontalHeader().setStretchLastSection(True)
         self.process_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.process_table.setStyleSheet("""
-            QTableWidget {
-                background: #353535;
-                color: #ffffff;
-                border: 1px solid #4a4a4a;
-                gridline-color: #4a4a4a;
-            }
-            QHeaderView::section {
-                background: #3c3c3c;
-                color: #00b4d8;
-                padding: 5px;
-                border: none;
-            }
-        """)
         self.process_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.process_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.process_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.process_table.verticalHeader().setDefaultSectionSize(PROCESS_TABLE_ROW_HEIGHT)
 
         process_layout.addWidget(self.process_table)
         process_group.setLayout(process_layout)
@@ -1131,7 +1980,7 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.limit_process_btn.clicked.connect(self.limit_selected_process)
 
         self.terminate_process_btn = QPushButton("❌ Terminate")
-        self.terminate_process_btn.setStyleSheet("background: #e74c3c; color: white;")
+        self.terminate_process_btn.setObjectName("terminateButton")
         self.terminate_process_btn.clicked.connect(self.terminate_selected_process)
 
         action_layout.addWidget(self.limit_process_btn)
@@ -1145,27 +1994,13 @@ class EnhancedRAMLimiterGUI(QWidget):
         advanced_process_group = QGroupBox("Advanced Process Management")
         advanced_layout = QVBoxLayout()
 
-        self.advanced_process_table = QTableWidget()
-        self.advanced_process_table.setColumnCount(8)
-        self.advanced_process_table.setHorizontalHeaderLabels([
-            "Process", "PID", "Memory (MB)", "CPU (%)",
-            "Threads", "Handles", "Priority", "Actions"
-        ])
+        self.advanced_process_table = QTableView()
+        self.advanced_process_table.setModel(self.advanced_process_model)
         self.advanced_process_table.horizontalHeader().setStretchLastSection(True)
-        self.advanced_process_table.setStyleSheet("""
-            QTableWidget {
-                background: #353535;
-                color: #ffffff;
-                border: 1px solid #4a4a4a;
-                gridline-color: #4a4a4a;
-            }
-            QHeaderView::section {
-                background: #3c3c3c;
-                color: #00b4d8;
-                padding: 5px;
-                border: none;
-            }
-        """)
+        self.advanced_process_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.advanced_process_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.advanced_process_table.verticalHeader().setDefaultSectionSize(PROCESS_TABLE_ROW_HEIGHT)
+        self.advanced_process_table.clicked.connect(self._on_advanced_table_clicked)
 
         advanced_layout.addWidget(self.advanced_process_table)
         advanced_process_group.setLayout(advanced_layout)
@@ -1188,21 +2023,7 @@ class EnhancedRAMLimiterGUI(QWidget):
         # Enable toggle
         self.game_mode_toggle = QPushButton("🎮 Enable Game Mode")
         self.game_mode_toggle.setCheckable(True)
-        self.game_mode_toggle.setStyleSheet("""
-            QPushButton {
-                background: #3c3c3c;
-                color: #ffffff;
-                padding: 15px;
-                font-size: 16px;
-                border-radius: 8px;
-            }
-            QPushButton:checked {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #e74c3c, stop:1 #c0392b);
-                color: white;
-                font-weight: bold;
-            }
-        """)
+        self.game_mode_toggle.setObjectName("gameModeToggle")
         self.game_mode_toggle.clicked.connect(self.toggle_game_mode)
 
         # Performance profile
@@ -1248,13 +2069,12 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.whitelist_edit = QLineEdit()
         self.whitelist_edit.setPlaceholderText("Enter processes to whitelist (comma-separated)")
         self.whitelist_list = QListWidget()
-        self.whitelist_list.setStyleSheet("""
-            QListWidget {
-                background: #353535;
-                color: #ffffff;
-                border: 1px solid #4a4a4a;
-            }
-        """)
+        self.whitelist_list.setUniformItemSizes(True)
+        # Python copy of the list's texts, in row order, kept in step with its model
+        self._whitelist_cache: List[str] = []
+        whitelist_model = self.whitelist_list.model()
+        whitelist_model.rowsInserted.connect(self._on_whitelist_rows_inserted)
+        whitelist_model.rowsRemoved.connect(self._on_whitelist_rows_removed)
 
         whitelist_button_layout = QHBoxLayout()
         self.add_whitelist_btn = QPushButton("➕ Add")
@@ -1277,7 +2097,7 @@ class EnhancedRAMLimiterGUI(QWidget):
         status_layout = QVBoxLayout()
 
         self.game_mode_status = QLabel("Game Mode: Disabled")
-        self.game_mode_status.setStyleSheet("font-size: 16px; font-weight: bold;")
+        self.game_mode_status.setObjectName("gameModeStatus")
         self.terminated_processes_label = QLabel("Processes terminated: 0")
         self.memory_freed_label = QLabel("Memory freed: 0 MB")
 
@@ -1359,6 +2179,9 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.export_profile_btn = QPushButton("📤 Export Profile")
         self.import_profile_btn = QPushButton("📥 Import Profile")
 
+        self.export_profile_btn.clicked.connect(self.export_profile)
+        self.import_profile_btn.clicked.connect(self.import_profile)
+
         profile_button_layout.addWidget(self.save_profile_btn)
         profile_button_layout.addWidget(self.delete_profile_btn)
         profile_button_layout.addWidget(self.export_profile_btn)
@@ -1378,15 +2201,7 @@ class EnhancedRAMLimiterGUI(QWidget):
 
         # Save button
         save_btn = QPushButton("💾 Save Settings")
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background: #2ecc71;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-        """)
+        save_btn.setObjectName("saveSettingsButton")
         save_btn.clicked.connect(self.save_settings)
         layout.addWidget(save_btn)
 
@@ -1401,18 +2216,11 @@ class EnhancedRAMLimiterGUI(QWidget):
         layout.setSpacing(15)
 
         # Notification list
-        self.notification_list = QListWidget()
-        self.notification_list.setStyleSheet("""
-            QListWidget {
-                background: #353535;
-                color: #ffffff;
-                border: 1px solid #4a4a4a;
-            }
-            QListWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #4a4a4a;
-            }
-        """)
+        self.notification_model = NotificationListModel(parent=self)
+        self.notification_list = QListView()
+        self.notification_list.setObjectName("notificationList")
+        self.notification_list.setModel(self.notification_model)
+        self.notification_list.setUniformItemSizes(True)
 
         # Notification controls
         control_layout = QHBoxLayout()
@@ -1445,6 +2253,11 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.health_chart.setLabel('left', 'Health Score', color='#ffffff')
         self.health_chart.setLabel('bottom', 'Time', color='#ffffff')
         self.health_chart.showGrid(x=True, y=True, alpha=0.3)
+        self.health_chart.setDownsampling(auto=True, mode='peak')
+        self.health_chart.setClipToView(True)
+        # Percent-based chart: fixed y-axis, so pyqtgraph never auto-ranges it
+        self.health_chart.disableAutoRange()
+        self.health_chart.setYRange(0, 100)
 
         self.health_curve = self.health_chart.plot(pen=pg.mkPen('#9b59b6', width=2), name="Health Score")
 
@@ -1455,6 +2268,10 @@ class EnhancedRAMLimiterGUI(QWidget):
         self.memory_history_chart.setLabel('left', 'Memory (MB)', color='#ffffff')
         self.memory_history_chart.setLabel('bottom', 'Time', color='#ffffff')
         self.memory_history_chart.showGrid(x=True, y=True, alpha=0.3)
+        self.memory_history_chart.setDownsampling(auto=True, mode='peak')
+        self.memory_history_chart.setClipToView(True)
+        self.memory_history_chart.disableAutoRange()
+        self._memory_y_max = 0.0
 
         self.memory_history_curve = self.memory_history_chart.plot(pen=pg.mkPen('#e74c3c', width=2), name="Memory Usage")
 
@@ -1487,9 +2304,25 @@ class EnhancedRAMLimiterGUI(QWidget):
         analytics_tab.setLayout(layout)
         return analytics_tab
 
-    def on_monitoring_data(self, system_info, process_history):
-        """Handle monitoring data received from background worker (runs on main thread)"""
+    def on_monitoring_data(self, snapshot: MonitoringSnapshot):
+        """Schedule a refresh when the background worker has new data (runs on main thread).
+
+        The snapshot itself is taken from the worker when the coalescing timer
+        fires, so the UI always shows the newest one and bursts cost one refresh.
+        """
+        if not self._monitoring_timer.isActive():
+            self._monitoring_timer.start()
+
+    def apply_monitoring_data(self):
+        """Refresh the UI from the newest monitoring snapshot"""
+        snapshot = self.monitoring_worker.take_snapshot()
+        if snapshot is None:
+            return
+
         try:
+            system_info = snapshot.system_info
+            process_history = snapshot.process_history
+
             # Store the data for use by update methods
             self.current_system_info = system_info
             self.current_process_history = process_history
@@ -1497,18 +2330,15 @@ class EnhancedRAMLimiterGUI(QWidget):
             # Also update the system_monitor's data for compatibility
             self.system_monitor.system_info = system_info
             self.system_monitor.process_history = process_history
+            self.system_monitor.top_memory_pids = snapshot.top_memory_pids
+            self.system_monitor.process_names = snapshot.process_names
 
-            # Update dashboard (safe - runs on main thread)
-            self.update_dashboard()
-
-            # Update process tables
-            self.update_process_tables()
-
-            # Update charts
-            self.update_charts()
+            # Repaint only the widgets of the visible tab; chart history is always recorded
+            self.refresh_visible_tab()
 
             # Check for notifications
-            self.check_system_alerts()
+            if self._refresh_due('alerts'):
+                self.check_system_alerts()
 
             # Update worker interval if refresh rate changed
             refresh_interval = self.config_manager.current_config['ui_settings']['refresh_interval']
@@ -1518,223 +2348,154 @@ class EnhancedRAMLimiterGUI(QWidget):
         except Exception as e:
             logging.error(f"Error in monitoring data handler: {e}")
 
+    def refresh_visible_tab(self):
+        """Update the widgets of the current tab from the latest monitoring data.
+
+        Each part is redrawn at most once per its ui_settings['widget_intervals'] entry.
+        """
+        current = self.tab_widget.currentWidget()
+        if current is self.dashboard_tab and self._refresh_due('dashboard'):
+            self.update_dashboard()
+        if (current is self.dashboard_tab or current is self.process_manager_tab) and self._refresh_due('process_tables'):
+            self.update_process_tables()
+        self.update_charts(current is self.dashboard_tab and self._refresh_due('charts'),
+                           current is self.analytics_tab and self._refresh_due('analytics'))
+
+    def _refresh_due(self, part: str) -> bool:
+        """True (and restart its interval) if this part of the UI may be redrawn now"""
+        interval = self.config_manager.current_config['ui_settings']['widget_intervals'].get(part, 0)
+        now = time.monotonic()
+        if now - self._last_refresh.get(part, float('-inf')) < interval:
+            return False
+        self._last_refresh[part] = now
+        return True
+
     def update_dashboard(self):
         """Update dashboard with current system information"""
         try:
             system_info = self.system_monitor.system_info
 
-            # Update health indicator
+            # Update health indicator; the label is restyled only when the status changes
             health_status = self.system_monitor.get_system_health()
-            health_colors = {
-                SystemHealthStatus.EXCELLENT: "#2ecc71",
-                SystemHealthStatus.GOOD: "#27ae60",
-                SystemHealthStatus.FAIR: "#f39c12",
-                SystemHealthStatus.POOR: "#e67e22",
-                SystemHealthStatus.CRITICAL: "#e74c3c"
-            }
-            color = health_colors.get(health_status, "#95a5a6")
-            self.health_indicator.setText(f"🏥 System Health: {health_status.value}")
-            self.health_indicator.setStyleSheet(f"""
-                QLabel {{
-                    font-size: 24px;
-                    font-weight: bold;
-                    padding: 15px;
-                    border-radius: 10px;
-                    background: {color};
-                    color: {'#ffffff' if color not in ['#2ecc71', '#27ae60'] else '#000000'};
-                }}
-            """)
-
-            # Update CPU stats
-            self.cpu_usage_label.setText(f"{system_info['cpu_usage']:.1f}%")
-            if system_info['cpu_frequency']:
-                self.cpu_freq_label.setText(f"{system_info['cpu_frequency']['current'] / 1000:.2f} GHz")
-            self.cpu_cores_label.setText(f"{system_info['cpu_cores']} cores")
+            if health_status != self._last_health:
+                self.health_indicator.setText(f"🏥 System Health: {health_status.value}")
+                _restyle(self.health_indicator, "health", health_status.name)
+                self._last_health = health_status
+
+            # Nothing to reformat if none of the displayed values changed
+            values = tuple(system_info[key] for key in DASHBOARD_KEYS)
+            if values == self._last_dashboard_values:
+                return
+            self._last_dashboard_values = values
+            (cpu_usage, memory_usage, memory_used, memory_total, memory_available, disk_usage,
+             disk_used, disk_total, disk_free, network_sent, network_received) = values
+
+            # Update CPU stats (core count and frequency are fixed and set when the tab is built)
+            set_text = self._set_label_text
+            set_text(self.cpu_usage_label, f"{cpu_usage:.1f}%")
 
             # Update memory stats
-            self.memory_usage_label.setText(f"{system_info['memory_usage']:.1f}%")
-            self.memory_used_label.setText(f"{system_info['memory_used'] / (1024 * 1024):.1f} / {system_info['memory_total'] / (1024 * 1024):.1f} GB")
-            self.memory_available_label.setText(f"{system_info['memory_available'] / (1024 * 1024):.1f} GB available")
+            set_text(self.memory_usage_label, f"{memory_usage:.1f}%")
+            set_text(self.memory_details_label,
+                     f"{memory_used * _GB_INV:.1f} / {memory_total * _GB_INV:.1f} GB\n"
+                     f"{memory_available * _GB_INV:.1f} GB available")
 
             # Update disk stats
-            self.disk_usage_label.setText(f"{system_info['disk_usage']:.1f}%")
-            self.disk_used_label.setText(f"{system_info['disk_used'] / (1024 * 1024 * 1024):.1f} / {system_info['disk_total'] / (1024 * 1024 * 1024):.1f} GB")
-            self.disk_free_label.setText(f"{system_info['disk_free'] / (1024 * 1024 * 1024):.1f} GB free")
+            set_text(self.disk_usage_label, f"{disk_usage:.1f}%")
+            set_text(self.disk_details_label,
+                     f"{disk_used * _GB_INV:.1f} / {disk_total * _GB_INV:.1f} GB\n"
+                     f"{disk_free * _GB_INV:.1f} GB free")
 
             # Update network stats
-            self.network_sent_label.setText(f"{system_info['network_sent'] / (1024 * 1024):.2f} MB sent")
-            self.network_received_label.setText(f"{system_info['network_received'] / (1024 * 1024):.2f} MB received")
-            total_network = (system_info['network_sent'] + system_info['network_received']) / (1024 * 1024)
-            self.network_total_label.setText(f"{total_network:.2f} MB total")
+            set_text(self.network_details_label,
+                     f"{network_sent * _MB_INV:.2f} MB sent\n"
+                     f"{network_received * _MB_INV:.2f} MB received\n"
+                     f"{(network_sent + network_received) * _MB_INV:.2f} MB total")
 
         except Exception as e:
             logging.error(f"Error updating dashboard: {e}")
 
+    def _set_label_text(self, label: QLabel, text: str):
+        """setText only when the text differs from what the label last showed"""
+        if self._label_texts.get(label) != text:
+            label.setText(text)
+            self._label_texts[label] = text
+
     def update_process_tables(self):
         """Update process tables with current process information"""
         try:
-            # Update main process table (top processes)
-            self.process_table.setRowCount(0)
-
-            # Sort processes by memory usage
-            sorted_processes = sorted(
-                self.system_monitor.process_history.values(),
-                key=lambda p: p.memory_usage,
-                reverse=True
-            )[:10]  # Top 10 processes
-
-            for row, proc_info in enumerate(sorted_processes):
-                self.process_table.insertRow(row)
-
-                # Process name
-                name_item = QTableWidgetItem(proc_info.name)
-                name_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
-                # PID
-                pid_item = QTableWidgetItem(str(proc_info.pid))
-                pid_item.setTextAlignment(Qt.AlignCenter)
-
-                # Memory usage
-                memory_item = QTableWidgetItem(f"{proc_info.memory_usage:.1f}")
-                memory_item.setTextAlignment(Qt.AlignRight)
-
-                # CPU usage
-                cpu_item = QTableWidgetItem(f"{proc_info.cpu_usage:.1f}")
-                cpu_item.setTextAlignment(Qt.AlignRight)
-
-                # Priority
-                priority_item = QTableWidgetItem(proc_info.priority.name.capitalize())
-                priority_item.setTextAlignment(Qt.AlignCenter)
-
-                self.process_table.setItem(row, 0, name_item)
-                self.process_table.setItem(row, 1, pid_item)
-                self.process_table.setItem(row, 2, memory_item)
-                self.process_table.setItem(row, 3, cpu_item)
-                self.process_table.setItem(row, 4, priority_item)
-
-            # Update advanced process table
-            self.advanced_process_table.setRowCount(0)
-
-            for row, proc_info in enumerate(self.system_monitor.process_history.values()):
-                self.advanced_process_table.insertRow(row)
-
-                # Process name
-                name_item = QTableWidgetItem(proc_info.name)
-
-                # PID
-                pid_item = QTableWidgetItem(str(proc_info.pid))
-                pid_item.setTextAlignment(Qt.AlignCenter)
-
-                # Memory usage
-                memory_item = QTableWidgetItem(f"{proc_info.memory_usage:.1f}")
-                memory_item.setTextAlignment(Qt.AlignRight)
-
-                # CPU usage
-                cpu_item = QTableWidgetItem(f"{proc_info.cpu_usage:.1f}")
-                cpu_item.setTextAlignment(Qt.AlignRight)
-
-                # Threads and Handles (placeholder for now)
-                threads_item = QTableWidgetItem("N/A")
-                handles_item = QTableWidgetItem("N/A")
-
-                # Priority
-                priority_item = QTableWidgetItem(proc_info.priority.name.capitalize())
-
-                # Actions button
-                actions_btn = QPushButton("⚙️")
-                actions_btn.setProperty("pid", proc_info.pid)
-                actions_btn.clicked.connect(self.show_process_actions)
-
-                self.advanced_process_table.setItem(row, 0, name_item)
-                self.advanced_process_table.setItem(row, 1, pid_item)
-                self.advanced_process_table.setItem(row, 2, memory_item)
-                self.advanced_process_table.setItem(row, 3, cpu_item)
-                self.advanced_process_table.setItem(row, 4, threads_item)
-                self.advanced_process_table.setItem(row, 5, handles_item)
-                self.advanced_process_table.setItem(row, 6, priority_item)
-                self.advanced_process_table.setCellWidget(row, 7, actions_btn)
+            # Update main process table (top processes, ranked by the monitor)
+            process_history = self.system_monitor.process_history
+            self.process_model.set_ranked([process_history[pid] for pid in self.system_monitor.top_memory_pids
+                                           if pid in process_history])
+
+            # Update advanced process table (once the process manager tab is built)
+            if self.advanced_process_table is not None:
+                self.advanced_process_model.set_keyed(process_history)
 
         except Exception as e:
             logging.error(f"Error updating process tables: {e}")
 
-    def update_charts(self):
-        """Update all charts with current data"""
+    def update_charts(self, redraw_load: bool = True, redraw_analytics: bool = True):
+        """Record chart samples and redraw the requested charts"""
         try:
             system_info = self.system_monitor.system_info
             current_time = time.time()
 
             # Update main load chart
-            self.chart_data['cpu'].append(system_info['cpu_usage'])
-            self.chart_data['memory'].append(system_info['memory_usage'])
-            self.chart_data['disk'].append(system_info['disk_usage'])
-            self.chart_data['timestamps'].append(current_time)
+            self.chart_data.append(current_time, system_info['cpu_usage'],
+                                   system_info['memory_usage'], system_info['disk_usage'])
 
             # Update curves
-            if len(self.chart_data['timestamps']) > 1:
-                # Convert timestamps to relative time for x-axis
-                start_time = self.chart_data['timestamps'][0]
-                x_data = [t - start_time for t in self.chart_data['timestamps']]
+            if redraw_load and len(self.chart_data) > 1:
+                # x-axis is time relative to the oldest sample
+                x_data, cpu, memory, disk = self.chart_data.series()
 
-                self.cpu_curve.setData(x_data, list(self.chart_data['cpu']))
-                self.memory_curve.setData(x_data, list(self.chart_data['memory']))
-                self.disk_curve.setData(x_data, list(self.chart_data['disk']))
+                self.cpu_curve.setData(x_data, cpu)
+                self.memory_curve.setData(x_data, memory)
+                self.disk_curve.setData(x_data, disk)
 
                 # Auto-range the view
-                self.load_chart.setXRange(0, max(x_data))
-                self.load_chart.setYRange(0, 100)
+                self.load_chart.setXRange(0, x_data[-1])
 
             # Update analytics charts
-            self.update_analytics_charts()
+            self.update_analytics_charts(redraw_analytics)
 
         except Exception as e:
             logging.error(f"Error updating charts: {e}")
 
-    def update_analytics_charts(self):
-        """Update analytics charts"""
+    def update_analytics_charts(self, redraw: bool = True):
+        """Record analytics samples and, if redraw is set, update the analytics charts"""
         try:
             # Health score calculation
-            health_status = self.system_monitor.get_system_health()
-            health_scores = {
-                SystemHealthStatus.EXCELLENT: 100,
-                SystemHealthStatus.GOOD: 75,
-                SystemHealthStatus.FAIR: 50,
-                SystemHealthStatus.POOR: 25,
-                SystemHealthStatus.CRITICAL: 10
-            }
-            health_score = health_scores.get(health_status, 50)
+            health_score = HEALTH_SCORES[self.system_monitor.get_health_bucket()]
 
             # Add health score to chart
             current_time = time.time()
-            if not hasattr(self, 'health_timestamps'):
-                self.health_timestamps = deque(maxlen=100)
-                self.health_scores = deque(maxlen=100)
-
-            self.health_timestamps.append(current_time)
-            self.health_scores.append(health_score)
-
-            if len(self.health_timestamps) > 1:
-                start_time = self.health_timestamps[0]
-                x_data = [t - start_time for t in self.health_timestamps]
-                self.health_curve.setData(x_data, list(self.health_scores))
-                self.health_chart.setXRange(0, max(x_data))
-                self.health_chart.setYRange(0, 100)
+            self.health_scores.append(current_time, health_score)
 
             # Memory usage history
             memory_usage_mb = self.system_monitor.system_info['memory_used'] / (1024 * 1024)
-            if not hasattr(self, 'memory_timestamps'):
-                self.memory_timestamps = deque(maxlen=100)
-                self.memory_usages = deque(maxlen=100)
+            self.memory_usages.append(current_time, memory_usage_mb)
 
-            self.memory_timestamps.append(current_time)
-            self.memory_usages.append(memory_usage_mb)
+            # The charts themselves only exist once the analytics tab has been opened
+            if not redraw or self.health_curve is None:
+                return
 
-            if len(self.memory_timestamps) > 1:
-                start_time = self.memory_timestamps[0]
-                x_data = [t - start_time for t in self.memory_timestamps]
-                self.memory_history_curve.setData(x_data, list(self.memory_usages))
-                self.memory_history_chart.setXRange(0, max(x_data))
-                max_memory = max(self.memory_usages) * 1.1 if self.memory_usages else 1000
-                self.memory_history_chart.setYRange(0, max_memory)
+            if len(self.health_scores) > 1:
+                x_data, scores = self.health_scores.series()
+                self.health_curve.setData(x_data, scores)
+                self.health_chart.setXRange(0, x_data[-1])
+
+            if len(self.memory_usages) > 1:
+                x_data, usages = self.memory_usages.series()
+                self.memory_history_curve.setData(x_data, usages)
+                self.memory_history_chart.setXRange(0, x_data[-1])
+                # Only move the y-axis ceiling when the peak outgrows it or falls well below it
+                peak = float(usages.max())
+                if peak > self._memory_y_max or peak * 2 < self._memory_y_max:
+                    self._memory_y_max = peak * 1.1
+                    self.memory_history_chart.setYRange(0, self._memory_y_max)
 
         except Exception as e:
             logging.error(f"Error updating analytics charts: {e}")
@@ -1745,33 +2506,45 @@ class EnhancedRAMLimiterGUI(QWidget):
             system_info = self.system_monitor.system_info
             health_status = self.system_monitor.get_system_health()
 
-            # High CPU alert
-            if system_info['cpu_usage'] > 90:
-                self.notification_center.notify(
-                    f"⚠️ High CPU usage: {system_info['cpu_usage']:.1f}%",
-                    NotificationType.WARNING
-                )
-
-            # High memory alert
-            if system_info['memory_usage'] > 90:
-                self.notification_center.notify(
-                    f"⚠️ High memory usage: {system_info['memory_usage']:.1f}%",
-                    NotificationType.WARNING
-                )
-
-            # Critical health alert
+            # Notify only when an alert is raised, not on every check while it lasts
+            raised = []
+            active = self._active_alerts
+            for key, (high, low) in ALERT_THRESHOLDS.items():
+                value = system_info[key]
+                if key in active:
+                    if value < low:
+                        active.discard(key)
+                elif value > high:
+                    active.add(key)
+                    raised.append(key)
             if health_status == SystemHealthStatus.CRITICAL:
-                self.notification_center.notify(
-                    "🚨 System health critical! Immediate action recommended.",
-                    NotificationType.ERROR
-                )
+                if 'health' not in active:
+                    active.add('health')
+                    raised.append('health')
+            else:
+                active.discard('health')
 
-            # Process count alert
-            if system_info['process_count'] > 200:
-                self.notification_center.notify(
-                    f"📈 High process count: {system_info['process_count']} processes running",
-                    NotificationType.WARNING
-                )
+            for key in raised:
+                if key == 'cpu_usage':
+                    self.notification_center.notify(
+                        f"⚠️ High CPU usage: {system_info['cpu_usage']:.1f}%",
+                        NotificationType.WARNING
+                    )
+                elif key == 'memory_usage':
+                    self.notification_center.notify(
+                        f"⚠️ High memory usage: {system_info['memory_usage']:.1f}%",
+                        NotificationType.WARNING
+                    )
+                elif key == 'health':
+                    self.notification_center.notify(
+                        "🚨 System health critical! Immediate action recommended.",
+                        NotificationType.ERROR
+                    )
+                elif key == 'process_count':
+                    self.notification_center.notify(
+                        f"📈 High process count: {system_info['process_count']} processes running",
+                        NotificationType.WARNING
+                    )
 
         except Exception as e:
             logging.error(f"Error checking system alerts: {e}")
@@ -1780,57 +2553,78 @@ class EnhancedRAMLimiterGUI(QWidget):
         """Handle notifications from various components"""
         self.notification_center.notify(message, notification_type)
 
-    def show_notification(self, message: str, notification_type: NotificationType):
-        """Display notification in the UI"""
+    def show_notifications(self, batch: List[Notification]):
+        """Display a batch of notifications in the UI"""
         try:
-            # Add to notification list
-            notification_item = QListWidgetItem()
-            notification_item.setText(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-
-            # Set color based on type
-            colors = {
-                NotificationType.INFO: "#3498db",
-                NotificationType.WARNING: "#f39c12",
-                NotificationType.ERROR: "#e74c3c",
-                NotificationType.SUCCESS: "#2ecc71"
-            }
-            color = colors.get(notification_type, "#95a5a6")
+            # Add to top of list, newest first, as a single row insertion
+            self.notification_model.add_batch(batch)
 
-            notification_item.setForeground(QColor(color))
-
-            # Add to top of list
-            self.notification_list.insertItem(0, notification_item)
-
-            # Show tray notification if enabled
+            # Show tray notification if enabled, summarised over TRAY_BATCH_MS
             if self.config_manager.current_config['notification_settings']['tray_notifications']:
-                self.tray_icon.showMessage(
-                    "RAM Limiter",
-                    message,
-                    QSystemTrayIcon.Information,
-                    3000
-                )
+                self._tray_buffer.extend(batch)
+                if not self._tray_timer.isActive():
+                    self._tray_timer.start()
 
         except Exception as e:
             logging.error(f"Error showing notification: {e}")
 
+    def _show_tray_summary(self):
+        """Show one tray balloon for the notifications buffered since the last one"""
+        buffered, self._tray_buffer = self._tray_buffer, []
+        if not buffered:
+            return
+        try:
+            last = buffered[-1]
+            message = last.message if len(buffered) == 1 else f"{len(buffered)} events: {last.message}"
+            warn = any(n.type in (NotificationType.WARNING, NotificationType.ERROR) for n in buffered)
+            self.tray_icon.showMessage(
+                "RAM Limiter",
+                message,
+                QSystemTrayIcon.Warning if warn else QSystemTrayIcon.Information,
+                3000
+            )
+        except Exception as e:
+            logging.error(f"Error showing tray notification: {e}")
+
     def clear_notifications(self):
         """Clear all notifications"""
-        self.notification_list.clear()
+        self.notification_model.clear()
         self.notification_center.mark_all_as_read()
 
     def mark_all_notifications_read(self):
         """Mark all notifications as read"""
         self.notification_center.mark_all_as_read()
-        for i in range(self.notification_list.count()):
-            item = self.notification_list.item(i)
-            item.setForeground(QColor("#95a5a6"))
+        self.notification_model.refresh_read_state()
 
     def refresh_process_list(self):
         """Refresh the process list in the combo box"""
         try:
-            self.process_combo.clear()
-            process_names = sorted(set(p.name for p in self.system_monitor.process_history.values()))
-            self.process_combo.addItems(process_names)
+            # The monitor republishes its sorted name tuple only when a name comes or goes
+            names = self.system_monitor.process_names
+            if names is self._combo_names:
+                return
+            self._combo_names = names
+
+            # Apply only the differences, so the combo keeps its items and current selection
+            process_names = set(names)
+            combo = self.process_combo
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            try:
+                shown = [combo.itemText(i) for i in range(combo.count())]
+                for row in range(len(shown) - 1, -1, -1):
+                    if shown[row] not in process_names:
+                        combo.removeItem(row)
+                        del shown[row]
+                # The list stays sorted, so new names are inserted at their sorted position
+                shown_names = set(shown)
+                for name in (name for name in names if name not in shown_names):
+                    row = bisect.bisect_left(shown, name)
+                    combo.insertItem(row, name)
+                    shown.insert(row, name)
+            finally:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
         except Exception as e:
             logging.error(f"Error refreshing process list: {e}")
 
@@ -1842,10 +2636,7 @@ class EnhancedRAMLimiterGUI(QWidget):
                 return
 
             priority_index = self.priority_combo.currentIndex()
-            priorities = [ProcessPriority.CRITICAL, ProcessPriority.HIGH,
-                         ProcessPriority.NORMAL, ProcessPriority.LOW,
-                         ProcessPriority.BACKGROUND]
-            priority = priorities[priority_index]
+            priority = PRIORITY_CHOICES[priority_index]
 
             self.memory_optimizer.set_process_priority(process_name, priority)
             self.notification_center.notify(
@@ -1871,37 +2662,27 @@ class EnhancedRAMLimiterGUI(QWidget):
             memory_limit = self.memory_limit_slider.value()
             self.memory_optimizer.set_process_priority(process_name, ProcessPriority.LOW)
 
-            # Find and limit the process
-            for pid, proc_info in self.system_monitor.process_history.items():
-                if proc_info.name == process_name:
-                    try:
-                        proc = psutil.Process(pid)
-                        total_ram = psutil.virtual_memory().total
-                        max_memory = int(total_ram * (memory_limit / 100))
-
-                        # Apply memory limit
-                        if platform.system() == 'Windows':
-                            handle = ctypes.windll.kernel32.OpenProcess(PROCESS_ALL_ACCESS, False, pid)
-                            if handle:
-                                try:
-                                    ctypes.windll.kernel32.SetProcessWorkingSetSize(handle, 0, max_memory)
-                                    gc.collect()
-                                finally:
-                                    ctypes.windll.kernel32.CloseHandle(handle)
-
-                        self.notification_center.notify(
-                            f"Limited {process_name} to {memory_limit}% of total RAM",
-                            NotificationType.SUCCESS
-                        )
-                        break
-
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+            # Find and limit the process; the Windows calls run on a pool thread
+            task = IOTask(_limit_process_memory, self.shared_monitor.pids_for_name(process_name), memory_limit)
+            task.signals.done.connect(lambda pid: self._process_limited(pid, process_name, memory_limit))
+            task.signals.error.connect(self._process_limit_failed)
+            task.start()
 
         except Exception as e:
             logging.error(f"Error limiting process: {e}")
             QMessageBox.critical(self, "Error", f"Failed to limit process: {str(e)}")
 
+    def _process_limited(self, pid: Optional[int], process_name: str, memory_limit: int):
+        if pid is not None:
+            self.notification_center.notify(
+                f"Limited {process_name} to {memory_limit}% of total RAM",
+                NotificationType.SUCCESS
+            )
+
+    def _process_limit_failed(self, error: str):
+        logging.error(f"Error limiting process: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to limit process: {error}")
+
     def terminate_selected_process(self):
         """Terminate selected process"""
         try:
@@ -1921,20 +2702,19 @@ class EnhancedRAMLimiterGUI(QWidget):
                 return
 
             # Terminate the process
-            for pid, proc_info in list(self.system_monitor.process_history.items()):
-                if proc_info.name == process_name:
-                    try:
-                        proc = psutil.Process(pid)
-                        proc.terminate()
+            for pid in self.shared_monitor.pids_for_name(process_name):
+                try:
+                    proc = psutil.Process(pid)
+                    proc.terminate()
 
-                        self.notification_center.notify(
-                            f"Terminated {process_name} (PID: {pid})",
-                            NotificationType.WARNING
-                        )
-                        return
+                    self.notification_center.notify(
+                        f"Terminated {process_name} (PID: {pid})",
+                        NotificationType.WARNING
+                    )
+                    return
 
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        continue
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    continue
 
             QMessageBox.warning(self, "Error", f"Could not terminate {process_name}")
 
@@ -1942,16 +2722,15 @@ class EnhancedRAMLimiterGUI(QWidget):
             logging.error(f"Error terminating process: {e}")
             QMessageBox.critical(self, "Error", f"Failed to terminate process: {str(e)}")
 
-    def show_process_actions(self):
+    def _on_advanced_table_clicked(self, index: QModelIndex):
+        if index.column() == ADVANCED_ACTIONS_COLUMN:
+            pid = self.advanced_process_model.pid_at(index.row())
+            if pid is not None:
+                self.show_process_actions(pid)
+
+    def show_process_actions(self, pid: int):
         """Show actions menu for a process"""
         try:
-            button = self.sender()
-            if not button:
-                return
-
-            pid = button.property("pid")
-            if not pid:
-                return
 
             # Find the process
             proc_info = self.system_monitor.process_history.get(pid)
@@ -2018,24 +2797,12 @@ class EnhancedRAMLimiterGUI(QWidget):
             if ok:
                 self.memory_optimizer.set_process_priority(proc_info.name, ProcessPriority.LOW)
 
-                # Apply the limit
-                proc = psutil.Process(pid)
-                total_ram = psutil.virtual_memory().total
-                max_memory = int(total_ram * (limit / 100))
-
-                if platform.system() == 'Windows':
-                    handle = ctypes.windll.kernel32.OpenProcess(PROCESS_ALL_ACCESS, False, pid)
-                    if handle:
-                        try:
-                            ctypes.windll.kernel32.SetProcessWorkingSetSize(handle, 0, max_memory)
-                            gc.collect()
-                        finally:
-                            ctypes.windll.kernel32.CloseHandle(handle)
-
-                self.notification_center.notify(
-                    f"Limited {proc_info.name} to {limit}% of total RAM",
-                    NotificationType.SUCCESS
-                )
+                # Apply the limit on a pool thread
+                name = proc_info.name
+                task = IOTask(_limit_process_memory, (pid,), limit)
+                task.signals.done.connect(lambda limited_pid: self._process_limited(limited_pid, name, limit))
+                task.signals.error.connect(self._process_limit_failed)
+                task.start()
 
         except Exception as e:
             logging.error(f"Error limiting process: {e}")
@@ -2075,29 +2842,27 @@ class EnhancedRAMLimiterGUI(QWidget):
             if enabled:
                 # Get current settings
                 ram_limit = self.game_ram_limit_spin.value()
-                whitelist = [self.whitelist_list.item(i).text() for i in range(self.whitelist_list.count())]
+                whitelist = list(self._whitelist_cache)
 
                 # Set performance profile
                 profile_index = self.game_profile_combo.currentIndex()
-                profiles = [PerformanceProfile.BALANCED, PerformanceProfile.GAMING,
-                           PerformanceProfile.WORK, PerformanceProfile.BATTERY_SAVER]
-                profile = profiles[profile_index]
+                profile = PERFORMANCE_PROFILE_CHOICES[profile_index]
 
                 # Configure and start Game Mode
                 self.game_mode.ram_limit_mb = ram_limit
-                self.game_mode.whitelist = whitelist
+                self.game_mode.set_whitelist(whitelist)
                 self.game_mode.set_performance_profile(profile)
                 self.game_mode.aggressiveness = self.aggressiveness_slider.value()
                 self.game_mode.start()
 
                 self.game_mode_status.setText("Game Mode: ENABLED")
-                self.game_mode_status.setStyleSheet("color: #2ecc71; font-weight: bold;")
+                _restyle(self.game_mode_status, "active", "true")
 
             else:
                 # Stop Game Mode
                 self.game_mode.stop()
                 self.game_mode_status.setText("Game Mode: DISABLED")
-                self.game_mode_status.setStyleSheet("color: #e74c3c; font-weight: bold;")
+                _restyle(self.game_mode_status, "active", "false")
 
         except Exception as e:
             logging.error(f"Error toggling Game Mode: {e}")
@@ -2107,9 +2872,7 @@ class EnhancedRAMLimiterGUI(QWidget):
     def update_game_profile(self, index: int):
         """Update Game Mode profile"""
         try:
-            profiles = [PerformanceProfile.BALANCED, PerformanceProfile.GAMING,
-                       PerformanceProfile.WORK, PerformanceProfile.BATTERY_SAVER]
-            profile = profiles[index]
+            profile = PERFORMANCE_PROFILE_CHOICES[index]
 
             # Update aggressiveness based on profile
             if profile == PerformanceProfile.GAMING:
@@ -2135,16 +2898,24 @@ class EnhancedRAMLimiterGUI(QWidget):
             if not processes:
                 return
 
+            listed = {name.lower() for name in self._whitelist_cache}
             for proc in processes.split(','):
                 proc = proc.strip().lower()
-                if proc and proc not in [self.whitelist_list.item(i).text().lower() for i in range(self.whitelist_list.count())]:
+                if proc and proc not in listed:
                     self.whitelist_list.addItem(proc)
+                    listed.add(proc)
 
             self.whitelist_edit.clear()
 
         except Exception as e:
             logging.error(f"Error adding to whitelist: {e}")
 
+    def _on_whitelist_rows_inserted(self, parent: QModelIndex, first: int, last: int):
+        self._whitelist_cache[first:first] = [self.whitelist_list.item(row).text() for row in range(first, last + 1)]
+
+    def _on_whitelist_rows_removed(self, parent: QModelIndex, first: int, last: int):
+        del self._whitelist_cache[first:last + 1]
+
     def remove_from_whitelist(self):
         """Remove selected process from whitelist"""
         try:
@@ -2157,10 +2928,7 @@ class EnhancedRAMLimiterGUI(QWidget):
     def optimize_now(self):
         """Perform immediate memory optimization"""
         try:
-            # Update system info
-            self.system_monitor.update_system_info()
-
-            # Perform optimization
+            # Perform optimization on the monitoring worker's latest data
             self.memory_optimizer._apply_memory_optimization()
 
             self.notification_center.notify(
@@ -2206,7 +2974,7 @@ class EnhancedRAMLimiterGUI(QWidget):
         try:
             if self.config_manager.current_config['advanced_settings']['auto_start']:
                 self.memory_optimizer.set_memory_strategy(
-                    MemoryManagementStrategy[self.config_manager.current_config['advanced_settings']['memory_strategy'].upper()]
+                    memory_strategy_for_key(self.config_manager.current_config['advanced_settings']['memory_strategy'])
                 )
                 self.memory_optimizer.start()
                 self.toggle_auto_btn.setChecked(True)
@@ -2225,13 +2993,13 @@ class EnhancedRAMLimiterGUI(QWidget):
             self.start_minimized_checkbox.setChecked(config['advanced_settings']['start_minimized'])
 
             # Memory settings
-            strategy_index = ['balanced', 'aggressive', 'conservative'].index(
-                config['advanced_settings']['memory_strategy'].lower()
+            strategy_index = MEMORY_STRATEGY_INDEX.get(
+                config['advanced_settings']['memory_strategy'].lower(), 0
             )
             self.memory_strategy_combo.setCurrentIndex(strategy_index)
 
-            mode_index = ['automatic', 'manual', 'learning'].index(
-                config['advanced_settings']['optimization_mode'].lower()
+            mode_index = OPTIMIZATION_MODE_INDEX.get(
+                config['advanced_settings']['optimization_mode'].lower(), 0
             )
             self.optimization_mode_combo.setCurrentIndex(mode_index)
 
@@ -2246,15 +3014,13 @@ class EnhancedRAMLimiterGUI(QWidget):
             self.game_ram_limit_spin.setValue(config['game_mode_settings']['ram_limit'])
             self.whitelist_list.addItems(config['game_mode_settings']['whitelist'])
 
-            profile_index = ['balanced', 'gaming', 'work', 'battery_saver'].index(
-                config['game_mode_settings']['performance_profile'].lower()
+            profile_index = PERFORMANCE_PROFILE_INDEX.get(
+                config['game_mode_settings']['performance_profile'].lower(), 0
             )
             self.game_profile_combo.setCurrentIndex(profile_index)
 
             # Apply memory strategy to optimizer
-            self.memory_optimizer.set_memory_strategy(
-                MemoryManagementStrategy[config['advanced_settings']['memory_strategy'].upper()]
-            )
+            self.memory_optimizer.set_memory_strategy(MEMORY_STRATEGY_CHOICES[strategy_index])
 
         except Exception as e:
             logging.error(f"Error loading settings: {e}")
@@ -2269,11 +3035,8 @@ class EnhancedRAMLimiterGUI(QWidget):
             config['advanced_settings']['start_minimized'] = self.start_minimized_checkbox.isChecked()
 
             # Memory settings
-            strategies = ['balanced', 'aggressive', 'conservative']
-            config['advanced_settings']['memory_strategy'] = strategies[self.memory_strategy_combo.currentIndex()]
-
-            modes = ['automatic', 'manual', 'learning']
-            config['advanced_settings']['optimization_mode'] = modes[self.optimization_mode_combo.currentIndex()]
+            config['advanced_settings']['memory_strategy'] = MEMORY_STRATEGY_KEYS[self.memory_strategy_combo.currentIndex()]
+            config['advanced_settings']['optimization_mode'] = OPTIMIZATION_MODE_KEYS[self.optimization_mode_combo.currentIndex()]
 
             config['ui_settings']['refresh_interval'] = self.refresh_interval_spin.value()
 
@@ -2284,12 +3047,9 @@ class EnhancedRAMLimiterGUI(QWidget):
 
             # Game Mode settings
             config['game_mode_settings']['ram_limit'] = self.game_ram_limit_spin.value()
-            config['game_mode_settings']['whitelist'] = [
-                self.whitelist_list.item(i).text() for i in range(self.whitelist_list.count())
-            ]
+            config['game_mode_settings']['whitelist'] = list(self._whitelist_cache)
 
-            profiles = ['balanced', 'gaming', 'work', 'battery_saver']
-            config['game_mode_settings']['performance_profile'] = profiles[self.game_profile_combo.currentIndex()]
+            config['game_mode_settings']['performance_profile'] = PERFORMANCE_PROFILE_KEYS[self.game_profile_combo.currentIndex()]
 
             # Save configuration
             self.config_manager.save_config()
@@ -2306,41 +3066,84 @@ class EnhancedRAMLimiterGUI(QWidget):
                 NotificationType.ERROR
             )
 
-    def setup_tray_icon(self):
-        """Setup system tray icon"""
-        self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(QIcon('ram.ico'))
+    def export_profile(self):
+        """Export the selected profile (or the current settings if it was never saved) to JSON"""
+        try:
+            name = self.profile_combo.currentText()
+            config = self.config_manager.current_config
+            settings = config['profiles'].get(name)
+            if settings is None:
+                settings = {key: value for key, value in config.items() if key not in ('profiles', 'version')}
 
-        tray_menu = QMenu()
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "Export Profile", f"{name}.json", "JSON Files (*.json);;All Files (*)"
+            )
+            if not file_path:
+                return
 
-        # Add menu items
-        show_action = QAction("Show", self)
-        show_action.triggered.connect(self.show_normal)
+            # Snapshot the settings here; the file is written on a pool thread
+            data = {'name': name, 'settings': copy.deepcopy(settings)}
+            task = IOTask(_write_json_file, data, file_path)
+            task.signals.done.connect(lambda _: self._profile_io_finished(
+                self.export_profile_btn, f"📤 Profile '{name}' exported to {file_path}"))
+            task.signals.error.connect(lambda error: self._profile_io_failed(self.export_profile_btn, error))
+            self.export_profile_btn.setEnabled(False)
+            task.start()
 
-        hide_action = QAction("Hide", self)
-        hide_action.triggered.connect(self.hide)
+        except Exception as e:
+            logging.error(f"Error exporting profile: {e}")
 
-        optimize_action = QAction("Optimize Now", self)
-        optimize_action.triggered.connect(self.optimize_now)
+    def import_profile(self):
+        """Import a profile exported by export_profile"""
+        try:
+            file_path, _ = QFileDialog.getOpenFileName(
+                self, "Import Profile", "", "JSON Files (*.json);;All Files (*)"
+            )
+            if not file_path:
+                return
+
+            task = IOTask(_read_profile_file, file_path)
+            task.signals.done.connect(self._profile_imported)
+            task.signals.error.connect(lambda error: self._profile_io_failed(self.import_profile_btn, error))
+            self.import_profile_btn.setEnabled(False)
+            task.start()
+
+        except Exception as e:
+            logging.error(f"Error importing profile: {e}")
+
+    def _profile_imported(self, result: Tuple[str, dict]):
+        name, settings = result
+        self.config_manager.create_profile(name, settings)
+        if self.profile_combo.findText(name) < 0:
+            self.profile_combo.addItem(name)
+        self.profile_combo.setCurrentText(name)
+        self._profile_io_finished(self.import_profile_btn, f"📥 Profile '{name}' imported")
 
-        game_mode_action = QAction("Toggle Game Mode", self)
-        game_mode_action.triggered.connect(lambda: self.game_mode_toggle.click())
+    def _profile_io_finished(self, button: QPushButton, message: str):
+        button.setEnabled(True)
+        self.notification_center.notify(message, NotificationType.SUCCESS)
 
-        settings_action = QAction("Settings", self)
-        settings_action.triggered.connect(lambda: self.tab_widget.setCurrentIndex(3))
+    def _profile_io_failed(self, button: QPushButton, error: str):
+        button.setEnabled(True)
+        logging.error(f"Profile import/export failed: {error}")
+        self.notification_center.notify(f"❌ Profile import/export failed: {error}", NotificationType.ERROR)
 
-        quit_action = QAction("Exit", self)
-        quit_action.triggered.connect(self.close)
+    def setup_tray_icon(self):
+        """Setup system tray icon"""
+        self.tray_icon = QSystemTrayIcon(self)
+        self.tray_icon.setIcon(QIcon('ram.ico'))
+
+        tray_menu = QMenu()
 
-        # Add actions to menu
-        tray_menu.addAction(show_action)
-        tray_menu.addAction(hide_action)
-        tray_menu.addSeparator()
-        tray_menu.addAction(optimize_action)
-        tray_menu.addAction(game_mode_action)
-        tray_menu.addAction(settings_action)
-        tray_menu.addSeparator()
-        tray_menu.addAction(quit_action)
+        # Add menu items; None is a separator
+        for item in TRAY_MENU_ITEMS:
+            if item is None:
+                tray_menu.addSeparator()
+                continue
+            label, slot_name = item
+            action = QAction(label, self)
+            action.triggered.connect(getattr(self, slot_name))
+            tray_menu.addAction(action)
 
         self.tray_icon.setContextMenu(tray_menu)
         self.tray_icon.show()
@@ -2348,6 +3151,12 @@ class EnhancedRAMLimiterGUI(QWidget):
         # Connect tray icon click
         self.tray_icon.activated.connect(self.tray_icon_activated)
 
+    def toggle_game_mode_from_tray(self):
+        self.game_mode_toggle.click()
+
+    def show_settings_tab(self):
+        self.tab_widget.setCurrentIndex(3)
+
     def tray_icon_activated(self, reason):
         """Handle tray icon activation"""
         if reason == QSystemTrayIcon.DoubleClick:
@@ -2363,45 +3172,53 @@ class EnhancedRAMLimiterGUI(QWidget):
     def export_analytics(self):
         """Export analytics data to file"""
         try:
-            # Prepare data for export
-            export_data = {
-                'system_info': dict(self.system_monitor.system_info),
-                'process_history': {
-                    pid: {
-                        'name': proc.name,
-                        'memory_usage': proc.memory_usage,
-                        'cpu_usage': proc.cpu_usage,
-                        'priority': proc.priority.name
-                    }
-                    for pid, proc in self.system_monitor.process_history.items()
-                },
-                'health_history': list(self.health_scores) if hasattr(self, 'health_scores') else [],
-                'memory_history': list(self.memory_usages) if hasattr(self, 'memory_usages') else [],
-                'timestamp': datetime.now().isoformat(),
-                'system_health': self.system_monitor.get_system_health().value
-            }
-
             # Get file path
             file_path, _ = QFileDialog.getSaveFileName(
                 self, "Export Analytics Data", "",
-                "JSON Files (*.json);;CSV Files (*.csv);;All Files (*)"
+                "JSON Files (*.json);;CSV Files (*.csv);;Compressed JSON (*.json.gz);;"
+                "Compressed CSV (*.csv.gz);;All Files (*)"
             )
 
             if file_path:
-                if file_path.endswith('.json'):
-                    with open(file_path, 'w') as f:
-                        json.dump(export_data, f, indent=4)
-                elif file_path.endswith('.csv'):
-                    self._export_to_csv(export_data, file_path)
+                # The snapshot's dicts are never modified once published, so the pool
+                # thread can read them directly
+                system_info = dict(self.system_monitor.system_info)
+                process_history = self.system_monitor.process_history
+                health_history = self.health_scores.values('score')
+                memory_history = self.memory_usages.values('memory_mb')
+
+                # Write on a pool thread; JSON is the default format
+                if file_path.endswith(('.csv', '.csv.gz')):
+                    # Rows are streamed from the process snapshot, with no intermediate dict
+                    task = IOTask(self._export_to_csv, system_info, process_history,
+                                  health_history, memory_history, file_path)
                 else:
-                    # Default to JSON
-                    with open(file_path, 'w') as f:
-                        json.dump(export_data, f, indent=4)
-
-                self.notification_center.notify(
+                    export_data = {
+                        'system_info': system_info,
+                        'process_history': {
+                            pid: {
+                                'name': proc.name,
+                                'memory_usage': proc.memory_usage,
+                                'cpu_usage': proc.cpu_usage,
+                                'priority': proc.priority.name
+                            }
+                            for pid, proc in process_history.items()
+                        },
+                        'health_history': health_history,
+                        'memory_history': memory_history,
+                        'timestamp': datetime.now().isoformat(),
+                        'system_health': self.system_monitor.get_system_health().value
+                    }
+                    task = IOTask(_write_json_file, export_data, file_path)
+                task.signals.done.connect(lambda _: self.notification_center.notify(
                     f"📊 Analytics exported to {file_path}",
                     NotificationType.SUCCESS
-                )
+                ))
+                task.signals.error.connect(lambda error: self.notification_center.notify(
+                    f"❌ Export failed: {error}",
+                    NotificationType.ERROR
+                ))
+                task.start()
 
         except Exception as e:
             logging.error(f"Error exporting analytics: {e}")
@@ -2410,29 +3227,32 @@ class EnhancedRAMLimiterGUI(QWidget):
                 NotificationType.ERROR
             )
 
-    def _export_to_csv(self, data: dict, file_path: str):
+    def _export_to_csv(self, system_info: Mapping[str, Any], process_history: Mapping[int, ProcessInfo],
+                       health_history: List[float], memory_history: List[float], file_path: str):
         """Export data to CSV format"""
         try:
-            with open(file_path, 'w', newline='') as f:
-                # Write system info
-                f.write("System Information\n")
-                for key, value in data['system_info'].items():
-                    f.write(f"{key},{value}\n")
-
-                f.write("\nProcess Information\n")
-                f.write("Name,PID,Memory (MB),CPU (%),Priority\n")
-                for pid, proc_data in data['process_history'].items():
-                    f.write(f"{proc_data['name']},{pid},{proc_data['memory_usage']},{proc_data['cpu_usage']},{proc_data['priority']}\n")
-
-                f.write("\nHealth History\n")
-                f.write("Health Score\n")
-                for score in data['health_history']:
-                    f.write(f"{score}\n")
-
-                f.write("\nMemory History\n")
-                f.write("Memory Usage (MB)\n")
-                for usage in data['memory_history']:
-                    f.write(f"{usage}\n")
+            # Build the whole file in memory, then write it out in one call
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator='\n')
+
+            # Write system info
+            writer.writerow(("System Information",))
+            writer.writerows(system_info.items())
+
+            writer.writerows(((), ("Process Information",), ("Name", "PID", "Memory (MB)", "CPU (%)", "Priority")))
+            writer.writerows(
+                (proc.name, pid, proc.memory_usage, proc.cpu_usage, proc.priority.name)
+                for pid, proc in process_history.items()
+            )
+
+            # The numeric history columns are formatted in one numpy call each
+            writer.writerows(((), ("Health History",), ("Health Score",)))
+            np.savetxt(buffer, np.asarray(health_history, dtype=np.float64), fmt='%.4f')
+
+            writer.writerows(((), ("Memory History",), ("Memory Usage (MB)",)))
+            np.savetxt(buffer, np.asarray(memory_history, dtype=np.float64), fmt='%.4f')
+
+            _write_export_file(buffer.getvalue().encode('utf-8'), file_path)
 
         except Exception as e:
             logging.error(f"Error exporting to CSV: {e}")
@@ -2483,6 +3303,7 @@ def main():
 
         # Set application style
         app.setStyle('Fusion')
+        app.setStyleSheet(APP_STYLESHEET)
 
         # Create and show main window
         window = EnhancedRAMLimiterGUI()
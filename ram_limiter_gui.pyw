@@ -1,12 +1,19 @@
 import sys
 import json
+import threading
 from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QCheckBox, QLineEdit,
                              QLabel, QTextEdit, QGroupBox, QSystemTrayIcon, QMenu, QAction, QFileDialog, QMessageBox, QGridLayout, QProgressBar, QInputDialog)
-from PyQt5.QtCore import QThread, pyqtSignal, QMetaType, Qt
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal, QMetaType, Qt
 from PyQt5.QtGui import QIcon
 import psutil
-from ram_limiter import limit_ram_for_process
 import pyqtgraph as pg
+import numpy as np
+
+# Optional faster JSON decoder for configuration files
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Register QVector<int> metatype to fix Qt signal/slot warnings across threads
 # This is required for pyqtgraph when emitting signals with QVector<int> arguments
@@ -15,6 +22,12 @@ try:
 except:
     pass
 
+# The label and progress bar are only updated when memory moved at least this much (in percent)
+MEMORY_CHANGE_THRESHOLD = 0.5
+# The graph gets one reading per second and is redrawn at most this often when it changed
+GRAPH_REDRAW_MS = 5000
+GRAPH_POINTS = 100
+
 class RAMLimiterThread(QThread):
     update_signal = pyqtSignal(str)
 
@@ -23,9 +36,18 @@ class RAMLimiterThread(QThread):
         self.process_name = process_name
         self.interval = interval
         self.max_memory_percent = max_memory_percent
+        self._stop = threading.Event()
 
     def run(self):
-        limit_ram_for_process(self.process_name, self.interval, self.max_memory_percent)
+        # ram_limiter binds the Windows APIs and loads wmi/pythoncom and colorama when
+        # imported, so it is imported on the first limiter thread rather than at startup
+        from ram_limiter import limit_ram_for_process
+        limit_ram_for_process(self.process_name, self.interval, self.max_memory_percent,
+                              stop_event=self._stop)
+
+    def stop(self):
+        """Ask the limiter loop to finish; it wakes from its interval sleep at once"""
+        self._stop.set()
 
 class GameModeThread(QThread):
     update_signal = pyqtSignal(str)
@@ -54,14 +76,20 @@ class GameModeThread(QThread):
 
 class SystemMemoryThread(QThread):
     update_signal = pyqtSignal(str, float)
+    # Every reading, for the graph
+    sample_signal = pyqtSignal(float)
 
     def run(self):
+        last_percent = None
         while True:
             mem = psutil.virtual_memory()
-            self.update_signal.emit(
-                f"System Memory: {mem.percent}% used | {mem.used / (1024 * 1024):.2f} MB used | {mem.available / (1024 * 1024):.2f} MB available",
-                mem.percent
-            )
+            self.sample_signal.emit(mem.percent)
+            if last_percent is None or abs(mem.percent - last_percent) >= MEMORY_CHANGE_THRESHOLD:
+                last_percent = mem.percent
+                self.update_signal.emit(
+                    f"System Memory: {mem.percent}% used | {mem.used / (1024 * 1024):.2f} MB used | {mem.available / (1024 * 1024):.2f} MB available",
+                    mem.percent
+                )
             self.sleep(1)
 
 class RAMLimiterGUI(QWidget):
@@ -240,8 +268,20 @@ class RAMLimiterGUI(QWidget):
         self.graph_widget.setLabel('left', 'Usage (%)')
         self.graph_widget.setLabel('bottom', 'Time (s)')
         self.graph_widget.showGrid(x=True, y=True)
+        # Both axes are fixed, so pyqtgraph never has to compute the data bounds
+        self.graph_widget.disableAutoRange()
+        self.graph_widget.setXRange(0, GRAPH_POINTS - 1)
+        self.graph_widget.setYRange(0, 100)
         self.curve = self.graph_widget.plot(pen='b')
-        self.data = []
+        # Ring of the last GRAPH_POINTS readings, one per second; memory_updates counts all readings
+        self.data = np.zeros(GRAPH_POINTS, np.float32)
+        self.graph_x = np.arange(GRAPH_POINTS, dtype=np.float32)
+        self.memory_updates = 0
+        self.graph_dirty = False
+        self.graph_timer = QTimer(self)
+        self.graph_timer.setInterval(GRAPH_REDRAW_MS)
+        self.graph_timer.timeout.connect(self.redraw_graph)
+        self.graph_timer.start()
         layout.addWidget(self.graph_widget)
 
         # Add animated progress bar for memory usage
@@ -266,6 +306,7 @@ class RAMLimiterGUI(QWidget):
         # Initialize system memory thread
         self.system_memory_thread = SystemMemoryThread()
         self.system_memory_thread.update_signal.connect(self.update_system_memory)
+        self.system_memory_thread.sample_signal.connect(self.add_memory_sample)
         self.system_memory_thread.start()
 
         # System tray icon
@@ -368,10 +409,11 @@ class RAMLimiterGUI(QWidget):
             self.output_area.append(f"Started limiting RAM for {process_name} (Max: {max_memory_percent}%)")
 
     def stop_limiting(self):
+        # Signal every thread first so they all wind down together, then wait for them
+        for thread in self.limiter_threads.values():
+            thread.stop()
         for thread in self.limiter_threads.values():
-            if thread.isRunning():
-                thread.terminate()
-                thread.wait()
+            thread.wait()
         self.limiter_threads.clear()
         self.output_area.append("Stopped all RAM limiting")
 
@@ -380,12 +422,28 @@ class RAMLimiterGUI(QWidget):
 
     def update_system_memory(self, message, usage):
         self.system_memory_label.setText(message)
-        self.data.append(usage)
-        if len(self.data) > 100:  # Keep only last 100 points
-            self.data = self.data[-100:]
-        self.curve.setData(self.data)
         self.memory_progress.setValue(int(usage))
 
+    def add_memory_sample(self, usage):
+        first = self.memory_updates == 0
+        self.data[self.memory_updates % GRAPH_POINTS] = usage
+        self.memory_updates += 1
+        self.graph_dirty = True
+        if first:
+            self.redraw_graph()
+
+    def redraw_graph(self):
+        if not self.graph_dirty:
+            return
+        self.graph_dirty = False
+        if self.memory_updates < GRAPH_POINTS:
+            count = self.memory_updates
+            self.curve.setData(self.graph_x[:count], self.data[:count], skipFiniteCheck=True)
+        else:
+            # Oldest reading first
+            self.curve.setData(self.graph_x, np.roll(self.data, -(self.memory_updates % GRAPH_POINTS)),
+                               skipFiniteCheck=True)
+
     def save_configuration(self):
         config = {
             "processes": {name: checkbox.isChecked() for name, checkbox in self.process_checkboxes.items()},
@@ -409,8 +467,9 @@ class RAMLimiterGUI(QWidget):
     def load_configuration(self):
         filename, _ = QFileDialog.getOpenFileName(self, "Load Configuration", "", "JSON Files (*.json)")
         if filename:
-            with open(filename, 'r') as f:
-                config = json.load(f)
+            with open(filename, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
             for name, checked in config["processes"].items():
                 if name in self.process_checkboxes:
                     self.process_checkboxes[name].setChecked(checked)
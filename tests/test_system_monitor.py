@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+try:
+    import ram_limiter_enhanced as rle
+except ImportError as e:
+    raise unittest.SkipTest(f"ram_limiter_enhanced dependencies missing: {e}")
+
+
+class FakeProcess:
+    """Stands in for psutil.Process; generation changes when the PID is reused"""
+
+    def __init__(self, table, pid):
+        self._table = table
+        self.pid = pid
+        self._generation, self._name = table[pid]
+
+    def is_running(self):
+        return self._table.get(self.pid, (None,))[0] == self._generation
+
+    def oneshot(self):
+        return mock.MagicMock()
+
+    def name(self):
+        return self._name
+
+    def memory_info(self):
+        return mock.Mock(rss=64 * 1024 * 1024)
+
+    def cpu_percent(self, interval=None):
+        return 0.0
+
+
+class UpdateProcessInfoTest(unittest.TestCase):
+    def setUp(self):
+        # pid -> (generation, name)
+        self.table = {}
+        patches = (
+            mock.patch.object(rle.psutil, 'pids', lambda: list(self.table)),
+            mock.patch.object(rle.psutil, 'Process', lambda pid: FakeProcess(self.table, pid)),
+            mock.patch.object(rle, '_IS_LINUX', False),
+        )
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        self.monitor = rle.SystemMonitor()
+
+    def test_pid_reused_by_process_with_same_name(self):
+        self.table[100] = (1, 'svchost.exe')
+        self.monitor._update_process_info()
+        old_info = self.monitor.process_history[100]
+
+        self.table[100] = (2, 'svchost.exe')
+        self.monitor._update_process_info()
+
+        self.assertIsNot(self.monitor.process_history[100], old_info)
+        self.assertEqual(self.monitor.pids_for_name('svchost.exe'), (100,))
+        self.assertEqual(self.monitor.process_names, ('svchost.exe',))
+
+    def test_pid_reused_by_process_with_other_name(self):
+        self.table[100] = (1, 'old.exe')
+        self.monitor._update_process_info()
+
+        self.table[100] = (2, 'new.exe')
+        self.monitor._update_process_info()
+
+        self.assertEqual(self.monitor.process_history[100].name, 'new.exe')
+        self.assertEqual(self.monitor.pids_for_name('old.exe'), ())
+        self.assertEqual(self.monitor.pids_for_name('new.exe'), (100,))
+        self.assertEqual(self.monitor.process_names, ('new.exe',))
+
+
+if __name__ == '__main__':
+    unittest.main()